@@ -1,11 +1,35 @@
 """Excel to ODCS parser - Convert Excel files back to ODCS JSON/YAML format."""
 
+import copy
+import functools
+import io
+import os
+import re
+import sys
 from pathlib import Path
-from typing import Any, Dict, Union, Optional
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Sequence,
+    Union,
+    Optional,
+)
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 from openpyxl import load_workbook
+from pydantic import TypeAdapter
+
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:  # Optional dependency, see the "fast" extra
+    CalamineWorkbook = None
 
 from .models import ODCSDataContract
 from .logging_config import get_logger
@@ -14,6 +38,133 @@ from .logging_utils import PerformanceTracker
 logger = get_logger(__name__)
 performance_tracker = PerformanceTracker()
 
+# Columns with at least this many values are type-converted in one vectorized
+# pass instead of calling _convert_value once per cell.
+BULK_CONVERSION_THRESHOLD = 1024
+
+# Value classifiers for _convert_value. _FLOAT_RE accepts exactly the dotted
+# strings float() can parse, so numeric cells never go through a failing call.
+_DIGITS = r"\d(?:_?\d)*"
+_INT_RE = re.compile(r"\d+")
+_FLOAT_RE = re.compile(
+    rf"[+-]?(?:{_DIGITS}\.(?:{_DIGITS})?|\.{_DIGITS})(?:[eE][+-]?{_DIGITS})?"
+)
+_BOOL_MAP = {"true": True, "false": False}
+
+# Built once at import so validate_odcs_data goes straight to the compiled
+# pydantic-core validator instead of unpacking data into the model __init__.
+_ODCS_ADAPTER = TypeAdapter(ODCSDataContract)
+
+
+def _convert_port(value: Any) -> Any:
+    """Convert a port cell to int, leaving unparseable values unchanged."""
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return value
+
+
+# Environment variable selecting the Excel reader: "calamine" or "openpyxl".
+# Defaults to calamine when python-calamine is installed.
+EXCEL_BACKEND_ENV_VAR = "ODCS_EXCEL_BACKEND"
+
+
+def _normalize_calamine_cell(value: Any) -> Any:
+    """Map a calamine cell onto the value openpyxl would have returned."""
+    if isinstance(value, str):
+        return value if value != "" else None
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _convert_port_column(values: Sequence[Any]) -> List[Any]:
+    """Convert a column of port cells, matching _convert_port per cell.
+
+    Large columns pick out plain digit strings with numpy string operations,
+    so only the remaining cells go through int() and its exception path.
+    """
+    if len(values) < BULK_CONVERSION_THRESHOLD:
+        return [None if value is None else _convert_port(value) for value in values]
+
+    converted = [
+        value if value is None or isinstance(value, str) else _convert_port(value)
+        for value in values
+    ]
+    text_positions = [i for i, value in enumerate(values) if isinstance(value, str)]
+    if not text_positions:
+        return converted
+
+    text = np.char.strip(np.array([values[i] for i in text_positions], dtype=str))
+    is_digits = np.char.isdecimal(text).tolist()
+    for position, cell, digits in zip(text_positions, text.tolist(), is_digits):
+        converted[position] = int(cell) if digits else _convert_port(values[position])
+    return converted
+
+
+# Column converters applied per worksheet while it is loaded, so typed columns
+# are converted once instead of inside every row loop. Each converter maps the
+# list of column values to a list of converted values.
+COLUMN_CONVERTERS = {
+    "Servers": {"Port": _convert_port_column},
+}
+
+
+# Environment variable enabling the in-process parse cache ("1" or "true").
+# Off by default; results are keyed by path, mtime and size, so any write to
+# the file invalidates its entry.
+PARSE_CACHE_ENV_VAR = "ODCS_PARSE_CACHE"
+
+
+def _parse_cache_enabled() -> bool:
+    """Check whether parse results may be served from the parse cache."""
+    return os.getenv(PARSE_CACHE_ENV_VAR, "").strip().lower() in ("1", "true")
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_cached(path: str, mtime_ns: int, size: int, backend: str) -> Dict[str, Any]:
+    """Parse an Excel file once per (path, mtime, size, backend) key.
+
+    The returned dictionary is shared between cache hits and must be copied
+    before it is handed to callers.
+    """
+    return ExcelToODCSParser()._parse_workbook(Path(path))
+
+
+class _LazyWorksheets(Mapping):
+    """Worksheet DataFrames that are only read from the workbook when accessed.
+
+    Sheets that no section parser asks for (instructions, user notes, ...) are
+    never streamed, normalized or type-converted.
+    """
+
+    def __init__(
+        self, sheet_names: Sequence[str], loader: Callable[[str], pd.DataFrame]
+    ):
+        self._sheet_names = list(sheet_names)
+        self._loader = loader
+        self._frames: Dict[str, pd.DataFrame] = {}
+
+    def __getitem__(self, sheet_name: str) -> pd.DataFrame:
+        if sheet_name not in self._frames:
+            if sheet_name not in self._sheet_names:
+                raise KeyError(sheet_name)
+            self._frames[sheet_name] = self._loader(sheet_name)
+        return self._frames[sheet_name]
+
+    def __contains__(self, sheet_name: object) -> bool:
+        return sheet_name in self._sheet_names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._sheet_names)
+
+    def __len__(self) -> int:
+        return len(self._sheet_names)
+
+    def loaded(self) -> Dict[str, pd.DataFrame]:
+        """Get the worksheets that have been loaded so far."""
+        return dict(self._frames)
+
 
 class ExcelToODCSParser:
     """Parse Excel files and convert them back to ODCS format."""
@@ -23,11 +174,12 @@ class ExcelToODCSParser:
         self.workbook = None
         self.worksheets = {}
 
-    def parse_from_file(self, excel_path: Union[str, Path]) -> Dict[str, Any]:
+    def parse_from_file(self, excel_path: Union[str, Path, BinaryIO]) -> Dict[str, Any]:
         """Parse Excel file and return ODCS dictionary.
 
         Args:
-            excel_path: Path to Excel file
+            excel_path: Path to Excel file, or a binary file-like object
+                positioned at the start of the workbook
 
         Returns:
             Dictionary containing ODCS data
@@ -36,12 +188,65 @@ class ExcelToODCSParser:
             FileNotFoundError: If Excel file doesn't exist
             ValueError: If Excel file format is invalid
         """
-        excel_path = Path(excel_path)
-        if not excel_path.exists():
-            raise FileNotFoundError(f"Excel file not found: {excel_path}")
+        is_stream = hasattr(excel_path, "read")
+        if not is_stream:
+            excel_path = Path(excel_path)
+            if not excel_path.exists():
+                raise FileNotFoundError(f"Excel file not found: {excel_path}")
+
+            if _parse_cache_enabled():
+                stat = excel_path.stat()
+                odcs_data = _parse_cached(
+                    str(excel_path.resolve()),
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                    os.getenv(EXCEL_BACKEND_ENV_VAR, ""),
+                )
+                return copy.deepcopy(odcs_data)
+
+        return self._parse_workbook(excel_path, is_stream)
+
+    def parse_from_buffer(self, buffer: bytes) -> Dict[str, Any]:
+        """Parse an Excel workbook held in memory and return ODCS dictionary.
+
+        Args:
+            buffer: Contents of an .xlsx file
+
+        Returns:
+            Dictionary containing ODCS data
+
+        Raises:
+            ValueError: If Excel file format is invalid
+        """
+        return self.parse_from_file(io.BytesIO(buffer))
 
+    def _parse_workbook(
+        self, excel_path: Union[Path, BinaryIO], is_stream: bool = False
+    ) -> Dict[str, Any]:
+        """Open and parse an Excel workbook without consulting the parse cache.
+
+        Args:
+            excel_path: Path to Excel file, or a binary file-like object
+            is_stream: Whether excel_path is a file-like object
+
+        Returns:
+            Dictionary containing ODCS data
+
+        Raises:
+            ValueError: If Excel file format is invalid
+        """
         try:
-            self.workbook = load_workbook(excel_path, read_only=True)
+            if self._use_calamine():
+                if is_stream:
+                    self.workbook = CalamineWorkbook.from_filelike(excel_path)
+                else:
+                    self.workbook = CalamineWorkbook.from_path(str(excel_path))
+            else:
+                # Rows are only streamed once, so skip building the cell DOM,
+                # formula strings and external link parts
+                self.workbook = load_workbook(
+                    excel_path, read_only=True, data_only=True, keep_links=False
+                )
             self._load_all_worksheets()
 
             odcs_data = self._parse_odcs_data()
@@ -53,46 +258,95 @@ class ExcelToODCSParser:
             logger.error(f"Failed to parse Excel file {excel_path}: {e}")
             raise ValueError(f"Invalid Excel file format: {e}")
         finally:
+            # Unloaded sheets cannot be read once the workbook is closed
+            if isinstance(self.worksheets, _LazyWorksheets):
+                self.worksheets = self.worksheets.loaded()
             if self.workbook:
                 self.workbook.close()
 
+    @staticmethod
+    def _use_calamine() -> bool:
+        """Check whether workbooks should be read with python-calamine."""
+        backend = os.getenv(EXCEL_BACKEND_ENV_VAR, "").strip().lower()
+        if backend == "openpyxl":
+            return False
+        if backend == "calamine" and CalamineWorkbook is None:
+            raise ImportError(
+                "python-calamine is required for the calamine Excel backend. "
+                "Install it with: pip install odcs-converter[fast]"
+            )
+        return CalamineWorkbook is not None
+
+    def _is_calamine_workbook(self) -> bool:
+        """Check whether the loaded workbook came from python-calamine."""
+        return CalamineWorkbook is not None and isinstance(
+            self.workbook, CalamineWorkbook
+        )
+
+    def _sheet_names(self) -> List[str]:
+        """Get worksheet names of the loaded workbook."""
+        if self._is_calamine_workbook():
+            return self.workbook.sheet_names
+        return self.workbook.sheetnames
+
+    def _iter_sheet_rows(self, sheet_name: str) -> Iterator[Sequence[Any]]:
+        """Iterate over the cell values of a worksheet, one tuple per row."""
+        if self._is_calamine_workbook():
+            sheet = self.workbook.get_sheet_by_name(sheet_name)
+            for row in sheet.to_python():
+                yield tuple(_normalize_calamine_cell(cell) for cell in row)
+        else:
+            yield from self.workbook[sheet_name].iter_rows(values_only=True)
+
     def _load_all_worksheets(self) -> None:
-        """Load all worksheets into pandas DataFrames."""
-        self.worksheets = {}
-        for sheet_name in self.workbook.sheetnames:
-            try:
-                # Read worksheet into DataFrame, treating first row as headers
-                # Use openpyxl engine and get data directly from workbook
-                sheet = self.workbook[sheet_name]
-                data = []
-                headers = []
-
-                # Get headers from first row
-                first_row = next(
-                    sheet.iter_rows(min_row=1, max_row=1, values_only=True), None
+        """Register all worksheets to be loaded into DataFrames on first use."""
+        self.worksheets = _LazyWorksheets(self._sheet_names(), self._load_worksheet)
+
+    def _load_worksheet(self, sheet_name: str) -> pd.DataFrame:
+        """Load a worksheet into a pandas DataFrame."""
+        try:
+            # Read worksheet into DataFrame, treating first row as headers
+            rows = self._iter_sheet_rows(sheet_name)
+            data = []
+            headers = []
+
+            # Get headers from first row
+            first_row = next(rows, None)
+            if first_row:
+                headers = [cell for cell in first_row if cell is not None]
+
+            # Get data from subsequent rows
+            for row in rows:
+                if any(cell is not None for cell in row):  # Skip empty rows
+                    row_data = list(row[: len(headers)] if headers else row)
+                    data.append(row_data)
+
+            # Create DataFrame
+            if headers and data:
+                df = pd.DataFrame(data, columns=headers)
+            elif headers:
+                df = pd.DataFrame(columns=headers)
+            else:
+                df = pd.DataFrame()
+            # Convert empty strings to None for better data handling
+            df = df.where(df != "", None)
+            df = self._apply_column_converters(sheet_name, df)
+            logger.debug(f"Loaded worksheet '{sheet_name}' with {len(df)} rows")
+            return df
+        except Exception as e:
+            logger.warning(f"Could not load worksheet '{sheet_name}': {e}")
+            return pd.DataFrame()
+
+    def _apply_column_converters(
+        self, sheet_name: str, df: pd.DataFrame
+    ) -> pd.DataFrame:
+        """Apply COLUMN_CONVERTERS registered for a worksheet to its DataFrame."""
+        for column, converter in COLUMN_CONVERTERS.get(sheet_name, {}).items():
+            if column in df.columns:
+                df[column] = pd.Series(
+                    converter(df[column].tolist()), index=df.index, dtype=object
                 )
-                if first_row:
-                    headers = [cell for cell in first_row if cell is not None]
-
-                # Get data from subsequent rows
-                for row in sheet.iter_rows(min_row=2, values_only=True):
-                    if any(cell is not None for cell in row):  # Skip empty rows
-                        row_data = list(row[: len(headers)] if headers else row)
-                        data.append(row_data)
-
-                # Create DataFrame
-                if headers and data:
-                    df = pd.DataFrame(data, columns=headers)
-                elif headers:
-                    df = pd.DataFrame(columns=headers)
-                else:
-                    df = pd.DataFrame()
-                # Convert empty strings to None for better data handling
-                df = df.where(df != "", None)
-                self.worksheets[sheet_name] = df
-                logger.debug(f"Loaded worksheet '{sheet_name}' with {len(df)} rows")
-            except Exception as e:
-                logger.warning(f"Could not load worksheet '{sheet_name}': {e}")
+        return df
 
     def _parse_odcs_data(self) -> Dict[str, Any]:
         """Parse all worksheets and construct ODCS data structure."""
@@ -136,9 +390,10 @@ class ExcelToODCSParser:
             return {}
 
         data = {}
-        for _, row in df.iterrows():
-            field = row.get("Field")
-            value = row.get("Value")
+        for field, value in zip(df["Field"].tolist(), df["Value"].tolist()):
+            if isinstance(field, str):
+                # Field names repeat across contracts; share one key object
+                field = sys.intern(field)
 
             if field and value is not None:
                 # Handle special field mappings
@@ -230,10 +485,8 @@ class ExcelToODCSParser:
                 value = row.get(excel_field)
                 if value is not None and value != "":
                     if odcs_field == "port":
-                        try:
-                            server[odcs_field] = int(value)
-                        except (ValueError, TypeError):
-                            server[odcs_field] = value
+                        # Already converted by COLUMN_CONVERTERS on load
+                        server[odcs_field] = value
                     else:
                         server[odcs_field] = str(value)
 
@@ -473,15 +726,15 @@ class ExcelToODCSParser:
         if df.empty or "Property" not in df.columns or "Value" not in df.columns:
             return {}
 
-        custom_properties = []
-        for _, row in df.iterrows():
-            prop = row.get("Property")
-            value = row.get("Value")
+        props = df["Property"].tolist()
+        values = df["Value"].tolist()
+        converted = self._convert_values(values)
 
-            if prop and value is not None:
-                custom_properties.append(
-                    {"property": str(prop), "value": self._convert_value(value)}
-                )
+        custom_properties = [
+            {"property": str(prop), "value": converted_value}
+            for prop, value, converted_value in zip(props, values, converted)
+            if prop and value is not None
+        ]
 
         return {"customProperties": custom_properties} if custom_properties else {}
 
@@ -831,26 +1084,63 @@ class ExcelToODCSParser:
         value_str = str(value).strip()
 
         # Try boolean
-        if value_str.lower() in ("true", "false"):
-            return value_str.lower() == "true"
+        boolean = _BOOL_MAP.get(value_str.lower())
+        if boolean is not None:
+            return boolean
 
         # Try integer
-        try:
-            if "." not in value_str and value_str.isdigit():
-                return int(value_str)
-        except (ValueError, AttributeError):
-            pass
+        if _INT_RE.fullmatch(value_str):
+            return int(value_str)
 
         # Try float
-        try:
-            if "." in value_str:
-                return float(value_str)
-        except (ValueError, AttributeError):
-            pass
+        if _FLOAT_RE.fullmatch(value_str):
+            return float(value_str)
 
         # Return as string
         return value_str
 
+    def _convert_values(self, values: Sequence[Any]) -> List[Any]:
+        """Convert a column of Excel values, matching _convert_value per cell.
+
+        Small columns are converted cell by cell. Large columns stringify the
+        text cells once and classify them with numpy string operations, so the
+        boolean/integer/float checks run over whole arrays.
+        """
+        if len(values) < BULK_CONVERSION_THRESHOLD:
+            return [self._convert_value(value) for value in values]
+
+        converted = [
+            None if value is None or value == "" else value for value in values
+        ]
+        text_positions = [
+            i
+            for i, value in enumerate(converted)
+            if value is not None and not isinstance(value, (bool, int, float))
+        ]
+        if not text_positions:
+            return converted
+
+        text = np.char.strip(
+            np.array([str(converted[i]) for i in text_positions], dtype=str)
+        )
+        lowered = np.char.lower(text)
+        is_bool = (lowered == "true") | (lowered == "false")
+        is_int = np.char.isdecimal(text)
+        is_float = np.fromiter(
+            (_FLOAT_RE.fullmatch(cell) is not None for cell in text.tolist()),
+            dtype=bool,
+            count=len(text),
+        )
+
+        results = text.astype(object)
+        results[is_bool] = (lowered[is_bool] == "true").tolist()
+        results[is_int] = [int(digits) for digits in text[is_int].tolist()]
+        results[is_float] = text[is_float].astype(np.float64).tolist()
+
+        for position, result in zip(text_positions, results.tolist()):
+            converted[position] = result
+        return converted
+
     def _clean_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Remove None values and empty structures from data."""
         cleaned = {}
@@ -888,7 +1178,7 @@ class ExcelToODCSParser:
             True if valid, False otherwise
         """
         try:
-            ODCSDataContract(**data)
+            _ODCS_ADAPTER.validate_python(data, strict=False)
             logger.info("ODCS data validation successful")
             return True
         except Exception as e:
@@ -1,11 +1,13 @@
 """Main ODCS Converter implementation."""
 
+import io
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, BinaryIO, Dict, List, Optional, Union
 
 import requests
 from openpyxl import Workbook
+from openpyxl.cell import Cell, WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment
 from openpyxl.utils import get_column_letter
 from pydantic import ValidationError
@@ -14,7 +16,6 @@ from .models import ODCSDataContract
 from .logging_config import get_logger
 from .logging_utils import PerformanceTracker
 
-
 logger = get_logger(__name__)
 performance_tracker = PerformanceTracker()
 
@@ -22,13 +23,18 @@ performance_tracker = PerformanceTracker()
 class ODCSToExcelConverter:
     """Convert ODCS JSON/YAML data to Excel format with separate worksheets."""
 
-    def __init__(self, style_config: Optional[Dict[str, Any]] = None):
+    def __init__(
+        self, style_config: Optional[Dict[str, Any]] = None, write_only: bool = True
+    ):
         """Initialize the generator with optional styling configuration.
 
         Args:
             style_config: Optional styling configuration for Excel output
+            write_only: Stream rows into a write-only workbook instead of
+                building every cell in memory
         """
         self.style_config = style_config or self._default_style_config()
+        self.write_only = write_only
 
     def _default_style_config(self) -> Dict[str, Any]:
         """Get default Excel styling configuration."""
@@ -81,13 +87,14 @@ class ODCSToExcelConverter:
 
     @performance_tracker.track_performance("generator.generate_from_dict")
     def generate_from_dict(
-        self, data: Dict[str, Any], output_path: Union[str, Path]
+        self, data: Dict[str, Any], output_path: Union[str, Path, BinaryIO]
     ) -> None:
         """Generate Excel file from ODCS data dictionary.
 
         Args:
             data: ODCS data as dictionary
-            output_path: Path to output Excel file
+            output_path: Path to output Excel file, or a binary file-like
+                object to write the workbook to
         """
         try:
             # Validate data against ODCS schema
@@ -97,16 +104,38 @@ class ODCSToExcelConverter:
             # Continue with raw data if validation fails
             contract = None
 
+        if not hasattr(output_path, "write"):
+            output_path = Path(output_path)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+
         # Generate Excel workbook
         workbook = self._create_workbook(data, contract)
 
         # Save to file
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        workbook.save(output_path)
+        try:
+            workbook.save(output_path)
+        except Exception:
+            # Write-only sheets keep their row streams open until saved
+            for sheet in workbook.worksheets:
+                if getattr(sheet, "closed", True) is False:
+                    sheet.close()
+            raise
 
         logger.info(f"Excel file generated successfully: {output_path}")
 
+    def generate_to_buffer(self, data: Dict[str, Any]) -> bytes:
+        """Generate an Excel workbook from ODCS data in memory.
+
+        Args:
+            data: ODCS data as dictionary
+
+        Returns:
+            Contents of the generated .xlsx file
+        """
+        buffer = io.BytesIO()
+        self.generate_from_dict(data, buffer)
+        return buffer.getvalue()
+
     def _create_workbook(
         self, data: Dict[str, Any], contract: Optional[ODCSDataContract]
     ) -> Workbook:
@@ -119,10 +148,11 @@ class ODCSToExcelConverter:
         Returns:
             Excel workbook
         """
-        workbook = Workbook()
+        workbook = Workbook(write_only=self.write_only)
 
-        # Remove default sheet
-        workbook.remove(workbook.active)
+        # Remove default sheet (write-only workbooks start without one)
+        if not self.write_only:
+            workbook.remove(workbook.active)
 
         # Create worksheets for each top-level field
         self._create_basic_info_sheet(workbook, data)
@@ -149,8 +179,6 @@ class ODCSToExcelConverter:
         self, workbook: Workbook, data: Dict[str, Any]
     ) -> None:
         """Create Basic Information worksheet."""
-        sheet = workbook.create_sheet("Basic Information")
-
         # Define basic info fields
         basic_fields = [
             ("version", "Contract Version"),
@@ -166,46 +194,21 @@ class ODCSToExcelConverter:
             ("contractCreatedTs", "Created Timestamp"),
         ]
 
-        # Add headers
         headers = ["Field", "Value", "Description"]
-        for col, header in enumerate(headers, 1):
-            cell = sheet.cell(row=1, column=col, value=header)
-            self._apply_header_style(cell)
-
-        # Add data rows
-        for row, (field_key, field_desc) in enumerate(basic_fields, 2):
-            sheet.cell(row=row, column=1, value=field_key)
-            sheet.cell(row=row, column=2, value=str(data.get(field_key, "")))
-            sheet.cell(row=row, column=3, value=field_desc)
-
-        self._auto_adjust_columns(sheet)
+        rows = [
+            [field_key, str(data.get(field_key, "")), field_desc]
+            for field_key, field_desc in basic_fields
+        ]
+        self._write_sheet(workbook, "Basic Information", headers, rows)
 
     def _create_tags_sheet(self, workbook: Workbook, tags: List[str]) -> None:
         """Create Tags worksheet."""
-        sheet = workbook.create_sheet("Tags")
-
-        # Add header
-        cell = sheet.cell(row=1, column=1, value="Tag")
-        self._apply_header_style(cell)
-
-        # Add tags
-        for row, tag in enumerate(tags, 2):
-            sheet.cell(row=row, column=1, value=tag)
-
-        self._auto_adjust_columns(sheet)
+        self._write_sheet(workbook, "Tags", ["Tag"], [[tag] for tag in tags])
 
     def _create_description_sheet(
         self, workbook: Workbook, description: Dict[str, Any]
     ) -> None:
         """Create Description worksheet."""
-        sheet = workbook.create_sheet("Description")
-
-        # Add headers
-        headers = ["Field", "Value"]
-        for col, header in enumerate(headers, 1):
-            cell = sheet.cell(row=1, column=col, value=header)
-            self._apply_header_style(cell)
-
         # Add description fields
         desc_fields = [
             ("usage", "Usage"),
@@ -213,23 +216,21 @@ class ODCSToExcelConverter:
             ("limitations", "Limitations"),
         ]
 
-        for row, (field_key, _) in enumerate(desc_fields, 2):
-            sheet.cell(row=row, column=1, value=field_key)
-            sheet.cell(row=row, column=2, value=str(description.get(field_key, "")))
-
-        self._auto_adjust_columns(sheet)
+        headers = ["Field", "Value"]
+        rows = [
+            [field_key, str(description.get(field_key, ""))]
+            for field_key, _ in desc_fields
+        ]
+        self._write_sheet(workbook, "Description", headers, rows)
 
     def _create_servers_sheet(
         self, workbook: Workbook, servers: List[Dict[str, Any]]
     ) -> None:
         """Create Servers worksheet."""
-        sheet = workbook.create_sheet("Servers")
-
         if not servers:
-            sheet.cell(row=1, column=1, value="No servers defined")
+            self._write_placeholder_sheet(workbook, "Servers", "No servers defined")
             return
 
-        # Add headers
         headers = [
             "Server",
             "Type",
@@ -240,34 +241,31 @@ class ODCSToExcelConverter:
             "Port",
             "Database",
         ]
-        for col, header in enumerate(headers, 1):
-            cell = sheet.cell(row=1, column=col, value=header)
-            self._apply_header_style(cell)
-
-        # Add server data
-        for row, server in enumerate(servers, 2):
-            sheet.cell(row=row, column=1, value=server.get("server", ""))
-            sheet.cell(row=row, column=2, value=server.get("type", ""))
-            sheet.cell(row=row, column=3, value=server.get("description", ""))
-            sheet.cell(row=row, column=4, value=server.get("environment", ""))
-            sheet.cell(row=row, column=5, value=server.get("location", ""))
-            sheet.cell(row=row, column=6, value=server.get("host", ""))
-            sheet.cell(row=row, column=7, value=server.get("port", ""))
-            sheet.cell(row=row, column=8, value=server.get("database", ""))
-
-        self._auto_adjust_columns(sheet)
+        rows = [
+            [
+                server.get("server", ""),
+                server.get("type", ""),
+                server.get("description", ""),
+                server.get("environment", ""),
+                server.get("location", ""),
+                server.get("host", ""),
+                server.get("port", ""),
+                server.get("database", ""),
+            ]
+            for server in servers
+        ]
+        self._write_sheet(workbook, "Servers", headers, rows)
 
     def _create_schema_sheet(
         self, workbook: Workbook, schema: List[Dict[str, Any]]
     ) -> None:
         """Create Schema worksheet."""
-        sheet = workbook.create_sheet("Schema")
-
         if not schema:
-            sheet.cell(row=1, column=1, value="No schema objects defined")
+            self._write_placeholder_sheet(
+                workbook, "Schema", "No schema objects defined"
+            )
             return
 
-        # Add headers
         headers = [
             "Object Name",
             "Physical Name",
@@ -281,68 +279,51 @@ class ODCSToExcelConverter:
             "Properties Count",
             "Auth Definitions Count",
         ]
-        for col, header in enumerate(headers, 1):
-            cell = sheet.cell(row=1, column=col, value=header)
-            self._apply_header_style(cell)
-
-        # Add schema objects
-        for row, obj in enumerate(schema, 2):
-            sheet.cell(row=row, column=1, value=obj.get("name", ""))
-            sheet.cell(row=row, column=2, value=obj.get("physicalName", ""))
-            sheet.cell(row=row, column=3, value=obj.get("logicalType", ""))
-            sheet.cell(row=row, column=4, value=obj.get("physicalType", ""))
-            sheet.cell(row=row, column=5, value=obj.get("description", ""))
-            sheet.cell(row=row, column=6, value=obj.get("businessName", ""))
-            sheet.cell(
-                row=row, column=7, value=obj.get("dataGranularityDescription", "")
-            )
-            sheet.cell(row=row, column=8, value=", ".join(obj.get("tags", [])))
-            sheet.cell(row=row, column=9, value=len(obj.get("quality", [])))
-            sheet.cell(row=row, column=10, value=len(obj.get("properties", [])))
-            sheet.cell(
-                row=row, column=11, value=len(obj.get("authoritativeDefinitions", []))
-            )
-
-        self._auto_adjust_columns(sheet)
+        rows = [
+            [
+                obj.get("name", ""),
+                obj.get("physicalName", ""),
+                obj.get("logicalType", ""),
+                obj.get("physicalType", ""),
+                obj.get("description", ""),
+                obj.get("businessName", ""),
+                obj.get("dataGranularityDescription", ""),
+                ", ".join(obj.get("tags", [])),
+                len(obj.get("quality", [])),
+                len(obj.get("properties", [])),
+                len(obj.get("authoritativeDefinitions", [])),
+            ]
+            for obj in schema
+        ]
+        self._write_sheet(workbook, "Schema", headers, rows)
 
     def _create_support_sheet(
         self, workbook: Workbook, support: List[Dict[str, Any]]
     ) -> None:
         """Create Support worksheet."""
-        sheet = workbook.create_sheet("Support")
-
         if not support:
-            sheet.cell(row=1, column=1, value="No support channels defined")
+            self._write_placeholder_sheet(
+                workbook, "Support", "No support channels defined"
+            )
             return
 
-        # Add headers
         headers = ["Channel", "URL", "Description", "Tool", "Scope"]
-        for col, header in enumerate(headers, 1):
-            cell = sheet.cell(row=1, column=col, value=header)
-            self._apply_header_style(cell)
-
-        # Add support data
-        for row, item in enumerate(support, 2):
-            sheet.cell(row=row, column=1, value=item.get("channel", ""))
-            sheet.cell(row=row, column=2, value=item.get("url", ""))
-            sheet.cell(row=row, column=3, value=item.get("description", ""))
-            sheet.cell(row=row, column=4, value=item.get("tool", ""))
-            sheet.cell(row=row, column=5, value=item.get("scope", ""))
-
-        self._auto_adjust_columns(sheet)
+        rows = [
+            [
+                item.get("channel", ""),
+                item.get("url", ""),
+                item.get("description", ""),
+                item.get("tool", ""),
+                item.get("scope", ""),
+            ]
+            for item in support
+        ]
+        self._write_sheet(workbook, "Support", headers, rows)
 
     def _create_pricing_sheet(
         self, workbook: Workbook, pricing: Dict[str, Any]
     ) -> None:
         """Create Pricing worksheet."""
-        sheet = workbook.create_sheet("Pricing")
-
-        # Add headers
-        headers = ["Field", "Value"]
-        for col, header in enumerate(headers, 1):
-            cell = sheet.cell(row=1, column=col, value=header)
-            self._apply_header_style(cell)
-
         # Add pricing fields
         pricing_fields = [
             ("priceAmount", "Price Amount"),
@@ -350,50 +331,43 @@ class ODCSToExcelConverter:
             ("priceUnit", "Price Unit"),
         ]
 
-        for row, (field_key, _) in enumerate(pricing_fields, 2):
-            sheet.cell(row=row, column=1, value=field_key)
-            sheet.cell(row=row, column=2, value=str(pricing.get(field_key, "")))
-
-        self._auto_adjust_columns(sheet)
+        headers = ["Field", "Value"]
+        rows = [
+            [field_key, str(pricing.get(field_key, ""))]
+            for field_key, _ in pricing_fields
+        ]
+        self._write_sheet(workbook, "Pricing", headers, rows)
 
     def _create_team_sheet(
         self, workbook: Workbook, team: List[Dict[str, Any]]
     ) -> None:
         """Create Team worksheet."""
-        sheet = workbook.create_sheet("Team")
-
         if not team:
-            sheet.cell(row=1, column=1, value="No team members defined")
+            self._write_placeholder_sheet(workbook, "Team", "No team members defined")
             return
 
-        # Add headers
         headers = ["Username", "Name", "Role", "Description", "Date In", "Date Out"]
-        for col, header in enumerate(headers, 1):
-            cell = sheet.cell(row=1, column=col, value=header)
-            self._apply_header_style(cell)
-
-        # Add team data
-        for row, member in enumerate(team, 2):
-            sheet.cell(row=row, column=1, value=member.get("username", ""))
-            sheet.cell(row=row, column=2, value=member.get("name", ""))
-            sheet.cell(row=row, column=3, value=member.get("role", ""))
-            sheet.cell(row=row, column=4, value=member.get("description", ""))
-            sheet.cell(row=row, column=5, value=member.get("dateIn", ""))
-            sheet.cell(row=row, column=6, value=member.get("dateOut", ""))
-
-        self._auto_adjust_columns(sheet)
+        rows = [
+            [
+                member.get("username", ""),
+                member.get("name", ""),
+                member.get("role", ""),
+                member.get("description", ""),
+                member.get("dateIn", ""),
+                member.get("dateOut", ""),
+            ]
+            for member in team
+        ]
+        self._write_sheet(workbook, "Team", headers, rows)
 
     def _create_roles_sheet(
         self, workbook: Workbook, roles: List[Dict[str, Any]]
     ) -> None:
         """Create Roles worksheet."""
-        sheet = workbook.create_sheet("Roles")
-
         if not roles:
-            sheet.cell(row=1, column=1, value="No roles defined")
+            self._write_placeholder_sheet(workbook, "Roles", "No roles defined")
             return
 
-        # Add headers
         headers = [
             "Role",
             "Description",
@@ -401,26 +375,22 @@ class ODCSToExcelConverter:
             "First Level Approvers",
             "Second Level Approvers",
         ]
-        for col, header in enumerate(headers, 1):
-            cell = sheet.cell(row=1, column=col, value=header)
-            self._apply_header_style(cell)
-
-        # Add roles data
-        for row, role in enumerate(roles, 2):
-            sheet.cell(row=row, column=1, value=role.get("role", ""))
-            sheet.cell(row=row, column=2, value=role.get("description", ""))
-            sheet.cell(row=row, column=3, value=role.get("access", ""))
-            sheet.cell(row=row, column=4, value=role.get("firstLevelApprovers", ""))
-            sheet.cell(row=row, column=5, value=role.get("secondLevelApprovers", ""))
-
-        self._auto_adjust_columns(sheet)
+        rows = [
+            [
+                role.get("role", ""),
+                role.get("description", ""),
+                role.get("access", ""),
+                role.get("firstLevelApprovers", ""),
+                role.get("secondLevelApprovers", ""),
+            ]
+            for role in roles
+        ]
+        self._write_sheet(workbook, "Roles", headers, rows)
 
     def _create_schema_properties_sheet(
         self, workbook: Workbook, schema: List[Dict[str, Any]]
     ) -> None:
         """Create Schema Properties worksheet with detailed property information."""
-        sheet = workbook.create_sheet("Schema Properties")
-
         # Collect all properties from all schema objects
         all_properties = []
         for obj in schema:
@@ -430,10 +400,11 @@ class ODCSToExcelConverter:
                 all_properties.append(prop_with_object)
 
         if not all_properties:
-            sheet.cell(row=1, column=1, value="No schema properties defined")
+            self._write_placeholder_sheet(
+                workbook, "Schema Properties", "No schema properties defined"
+            )
             return
 
-        # Add headers
         headers = [
             "Object Name",
             "Property Name",
@@ -459,52 +430,40 @@ class ODCSToExcelConverter:
             "Quality Rules Count",
             "Auth Definitions Count",
         ]
-        for col, header in enumerate(headers, 1):
-            cell = sheet.cell(row=1, column=col, value=header)
-            self._apply_header_style(cell)
-
-        # Add properties
-        for row, prop in enumerate(all_properties, 2):
-            sheet.cell(row=row, column=1, value=prop.get("object_name", ""))
-            sheet.cell(row=row, column=2, value=prop.get("name", ""))
-            sheet.cell(row=row, column=3, value=prop.get("logicalType", ""))
-            sheet.cell(row=row, column=4, value=prop.get("physicalType", ""))
-            sheet.cell(row=row, column=5, value=prop.get("physicalName", ""))
-            sheet.cell(row=row, column=6, value=prop.get("description", ""))
-            sheet.cell(row=row, column=7, value=prop.get("businessName", ""))
-            sheet.cell(row=row, column=8, value=prop.get("required", False))
-            sheet.cell(row=row, column=9, value=prop.get("unique", False))
-            sheet.cell(row=row, column=10, value=prop.get("primaryKey", False))
-            sheet.cell(row=row, column=11, value=prop.get("primaryKeyPosition", -1))
-            sheet.cell(row=row, column=12, value=prop.get("partitioned", False))
-            sheet.cell(row=row, column=13, value=prop.get("partitionKeyPosition", -1))
-            sheet.cell(row=row, column=14, value=prop.get("classification", ""))
-            sheet.cell(row=row, column=15, value=prop.get("encryptedName", ""))
-            sheet.cell(row=row, column=16, value=prop.get("criticalDataElement", False))
-            sheet.cell(
-                row=row,
-                column=17,
-                value=", ".join(prop.get("transformSourceObjects", [])),
-            )
-            sheet.cell(row=row, column=18, value=prop.get("transformLogic", ""))
-            sheet.cell(row=row, column=19, value=prop.get("transformDescription", ""))
-            sheet.cell(
-                row=row, column=20, value=", ".join(map(str, prop.get("examples", [])))
-            )
-            sheet.cell(row=row, column=21, value=", ".join(prop.get("tags", [])))
-            sheet.cell(row=row, column=22, value=len(prop.get("quality", [])))
-            sheet.cell(
-                row=row, column=23, value=len(prop.get("authoritativeDefinitions", []))
-            )
-
-        self._auto_adjust_columns(sheet)
+        rows = [
+            [
+                prop.get("object_name", ""),
+                prop.get("name", ""),
+                prop.get("logicalType", ""),
+                prop.get("physicalType", ""),
+                prop.get("physicalName", ""),
+                prop.get("description", ""),
+                prop.get("businessName", ""),
+                prop.get("required", False),
+                prop.get("unique", False),
+                prop.get("primaryKey", False),
+                prop.get("primaryKeyPosition", -1),
+                prop.get("partitioned", False),
+                prop.get("partitionKeyPosition", -1),
+                prop.get("classification", ""),
+                prop.get("encryptedName", ""),
+                prop.get("criticalDataElement", False),
+                ", ".join(prop.get("transformSourceObjects", [])),
+                prop.get("transformLogic", ""),
+                prop.get("transformDescription", ""),
+                ", ".join(map(str, prop.get("examples", []))),
+                ", ".join(prop.get("tags", [])),
+                len(prop.get("quality", [])),
+                len(prop.get("authoritativeDefinitions", [])),
+            ]
+            for prop in all_properties
+        ]
+        self._write_sheet(workbook, "Schema Properties", headers, rows)
 
     def _create_logical_type_options_sheet(
         self, workbook: Workbook, schema: List[Dict[str, Any]]
     ) -> None:
         """Create Logical Type Options worksheet."""
-        sheet = workbook.create_sheet("Logical Type Options")
-
         # Collect all properties with logical type options
         options_data = []
         for obj in schema:
@@ -522,10 +481,11 @@ class ODCSToExcelConverter:
                     )
 
         if not options_data:
-            sheet.cell(row=1, column=1, value="No logical type options defined")
+            self._write_placeholder_sheet(
+                workbook, "Logical Type Options", "No logical type options defined"
+            )
             return
 
-        # Add headers
         headers = [
             "Object Name",
             "Property Name",
@@ -546,39 +506,35 @@ class ODCSToExcelConverter:
             "Max Properties",
             "Required Properties",
         ]
-        for col, header in enumerate(headers, 1):
-            cell = sheet.cell(row=1, column=col, value=header)
-            self._apply_header_style(cell)
-
-        # Add options data
-        for row, options in enumerate(options_data, 2):
-            sheet.cell(row=row, column=1, value=options.get("object_name", ""))
-            sheet.cell(row=row, column=2, value=options.get("property_name", ""))
-            sheet.cell(row=row, column=3, value=options.get("logical_type", ""))
-            sheet.cell(row=row, column=4, value=options.get("format", ""))
-            sheet.cell(row=row, column=5, value=options.get("minLength", ""))
-            sheet.cell(row=row, column=6, value=options.get("maxLength", ""))
-            sheet.cell(row=row, column=7, value=options.get("pattern", ""))
-            sheet.cell(row=row, column=8, value=options.get("minimum", ""))
-            sheet.cell(row=row, column=9, value=options.get("maximum", ""))
-            sheet.cell(row=row, column=10, value=options.get("exclusiveMinimum", ""))
-            sheet.cell(row=row, column=11, value=options.get("exclusiveMaximum", ""))
-            sheet.cell(row=row, column=12, value=options.get("multipleOf", ""))
-            sheet.cell(row=row, column=13, value=options.get("minItems", ""))
-            sheet.cell(row=row, column=14, value=options.get("maxItems", ""))
-            sheet.cell(row=row, column=15, value=options.get("uniqueItems", ""))
-            sheet.cell(row=row, column=16, value=options.get("minProperties", ""))
-            sheet.cell(row=row, column=17, value=options.get("maxProperties", ""))
-            sheet.cell(row=row, column=18, value=", ".join(options.get("required", [])))
-
-        self._auto_adjust_columns(sheet)
+        rows = [
+            [
+                options.get("object_name", ""),
+                options.get("property_name", ""),
+                options.get("logical_type", ""),
+                options.get("format", ""),
+                options.get("minLength", ""),
+                options.get("maxLength", ""),
+                options.get("pattern", ""),
+                options.get("minimum", ""),
+                options.get("maximum", ""),
+                options.get("exclusiveMinimum", ""),
+                options.get("exclusiveMaximum", ""),
+                options.get("multipleOf", ""),
+                options.get("minItems", ""),
+                options.get("maxItems", ""),
+                options.get("uniqueItems", ""),
+                options.get("minProperties", ""),
+                options.get("maxProperties", ""),
+                ", ".join(options.get("required", [])),
+            ]
+            for options in options_data
+        ]
+        self._write_sheet(workbook, "Logical Type Options", headers, rows)
 
     def _create_quality_rules_sheet(
         self, workbook: Workbook, schema: List[Dict[str, Any]]
     ) -> None:
         """Create Quality Rules worksheet."""
-        sheet = workbook.create_sheet("Quality Rules")
-
         # Collect all quality rules from objects and properties
         all_rules = []
         for obj in schema:
@@ -607,10 +563,11 @@ class ODCSToExcelConverter:
                     all_rules.append(rule_with_context)
 
         if not all_rules:
-            sheet.cell(row=1, column=1, value="No quality rules defined")
+            self._write_placeholder_sheet(
+                workbook, "Quality Rules", "No quality rules defined"
+            )
             return
 
-        # Add headers
         headers = [
             "Object Name",
             "Property Name",
@@ -640,126 +597,132 @@ class ODCSToExcelConverter:
             "Schedule",
             "Tags",
         ]
-        for col, header in enumerate(headers, 1):
-            cell = sheet.cell(row=1, column=col, value=header)
-            self._apply_header_style(cell)
-
-        # Add quality rules
-        for row, rule in enumerate(all_rules, 2):
-            sheet.cell(row=row, column=1, value=rule.get("object_name", ""))
-            sheet.cell(row=row, column=2, value=rule.get("property_name", ""))
-            sheet.cell(row=row, column=3, value=rule.get("level", ""))
-            sheet.cell(row=row, column=4, value=rule.get("name", ""))
-            sheet.cell(row=row, column=5, value=rule.get("description", ""))
-            sheet.cell(row=row, column=6, value=rule.get("type", ""))
-            sheet.cell(row=row, column=7, value=rule.get("rule", ""))
-            sheet.cell(row=row, column=8, value=rule.get("dimension", ""))
-            sheet.cell(row=row, column=9, value=rule.get("severity", ""))
-            sheet.cell(row=row, column=10, value=rule.get("businessImpact", ""))
-            sheet.cell(row=row, column=11, value=rule.get("unit", ""))
-            sheet.cell(
-                row=row,
-                column=12,
-                value=", ".join(map(str, rule.get("validValues", []))),
-            )
-            sheet.cell(row=row, column=13, value=rule.get("query", ""))
-            sheet.cell(row=row, column=14, value=rule.get("engine", ""))
-            sheet.cell(row=row, column=15, value=rule.get("implementation", ""))
-            sheet.cell(row=row, column=16, value=rule.get("mustBe", ""))
-            sheet.cell(row=row, column=17, value=rule.get("mustNotBe", ""))
-            sheet.cell(row=row, column=18, value=rule.get("mustBeGreaterThan", ""))
-            sheet.cell(row=row, column=19, value=rule.get("mustBeGreaterOrEqualTo", ""))
-            sheet.cell(row=row, column=20, value=rule.get("mustBeLessThan", ""))
-            sheet.cell(row=row, column=21, value=rule.get("mustBeLessOrEqualTo", ""))
-            sheet.cell(
-                row=row,
-                column=22,
-                value=", ".join(map(str, rule.get("mustBeBetween", []))),
-            )
-            sheet.cell(
-                row=row,
-                column=23,
-                value=", ".join(map(str, rule.get("mustNotBeBetween", []))),
-            )
-            sheet.cell(row=row, column=24, value=rule.get("method", ""))
-            sheet.cell(row=row, column=25, value=rule.get("scheduler", ""))
-            sheet.cell(row=row, column=26, value=rule.get("schedule", ""))
-            sheet.cell(row=row, column=27, value=", ".join(rule.get("tags", [])))
-
-        self._auto_adjust_columns(sheet)
+        rows = [
+            [
+                rule.get("object_name", ""),
+                rule.get("property_name", ""),
+                rule.get("level", ""),
+                rule.get("name", ""),
+                rule.get("description", ""),
+                rule.get("type", ""),
+                rule.get("rule", ""),
+                rule.get("dimension", ""),
+                rule.get("severity", ""),
+                rule.get("businessImpact", ""),
+                rule.get("unit", ""),
+                ", ".join(map(str, rule.get("validValues", []))),
+                rule.get("query", ""),
+                rule.get("engine", ""),
+                rule.get("implementation", ""),
+                rule.get("mustBe", ""),
+                rule.get("mustNotBe", ""),
+                rule.get("mustBeGreaterThan", ""),
+                rule.get("mustBeGreaterOrEqualTo", ""),
+                rule.get("mustBeLessThan", ""),
+                rule.get("mustBeLessOrEqualTo", ""),
+                ", ".join(map(str, rule.get("mustBeBetween", []))),
+                ", ".join(map(str, rule.get("mustNotBeBetween", []))),
+                rule.get("method", ""),
+                rule.get("scheduler", ""),
+                rule.get("schedule", ""),
+                ", ".join(rule.get("tags", [])),
+            ]
+            for rule in all_rules
+        ]
+        self._write_sheet(workbook, "Quality Rules", headers, rows)
 
     def _create_sla_properties_sheet(
         self, workbook: Workbook, sla_properties: List[Dict[str, Any]]
     ) -> None:
         """Create SLA Properties worksheet."""
-        sheet = workbook.create_sheet("SLA Properties")
-
         if not sla_properties:
-            sheet.cell(row=1, column=1, value="No SLA properties defined")
+            self._write_placeholder_sheet(
+                workbook, "SLA Properties", "No SLA properties defined"
+            )
             return
 
-        # Add headers
         headers = ["Property", "Value", "Value Ext", "Unit", "Element", "Driver"]
-        for col, header in enumerate(headers, 1):
-            cell = sheet.cell(row=1, column=col, value=header)
-            self._apply_header_style(cell)
-
-        # Add SLA data
-        for row, prop in enumerate(sla_properties, 2):
-            sheet.cell(row=row, column=1, value=prop.get("property", ""))
-            sheet.cell(row=row, column=2, value=str(prop.get("value", "")))
-            sheet.cell(row=row, column=3, value=str(prop.get("valueExt", "")))
-            sheet.cell(row=row, column=4, value=prop.get("unit", ""))
-            sheet.cell(row=row, column=5, value=prop.get("element", ""))
-            sheet.cell(row=row, column=6, value=prop.get("driver", ""))
-
-        self._auto_adjust_columns(sheet)
+        rows = [
+            [
+                prop.get("property", ""),
+                str(prop.get("value", "")),
+                str(prop.get("valueExt", "")),
+                prop.get("unit", ""),
+                prop.get("element", ""),
+                prop.get("driver", ""),
+            ]
+            for prop in sla_properties
+        ]
+        self._write_sheet(workbook, "SLA Properties", headers, rows)
 
     def _create_authoritative_definitions_sheet(
         self, workbook: Workbook, definitions: List[Dict[str, Any]]
     ) -> None:
         """Create Authoritative Definitions worksheet."""
-        sheet = workbook.create_sheet("Authoritative Definitions")
-
         if not definitions:
-            sheet.cell(row=1, column=1, value="No authoritative definitions defined")
+            self._write_placeholder_sheet(
+                workbook,
+                "Authoritative Definitions",
+                "No authoritative definitions defined",
+            )
             return
 
-        # Add headers
         headers = ["URL", "Type"]
-        for col, header in enumerate(headers, 1):
-            cell = sheet.cell(row=1, column=col, value=header)
-            self._apply_header_style(cell)
-
-        # Add definitions data
-        for row, definition in enumerate(definitions, 2):
-            sheet.cell(row=row, column=1, value=definition.get("url", ""))
-            sheet.cell(row=row, column=2, value=definition.get("type", ""))
-
-        self._auto_adjust_columns(sheet)
+        rows = [
+            [definition.get("url", ""), definition.get("type", "")]
+            for definition in definitions
+        ]
+        self._write_sheet(workbook, "Authoritative Definitions", headers, rows)
 
     def _create_custom_properties_sheet(
         self, workbook: Workbook, custom_properties: List[Dict[str, Any]]
     ) -> None:
         """Create Custom Properties worksheet."""
-        sheet = workbook.create_sheet("Custom Properties")
-
         if not custom_properties:
-            sheet.cell(row=1, column=1, value="No custom properties defined")
+            self._write_placeholder_sheet(
+                workbook, "Custom Properties", "No custom properties defined"
+            )
             return
 
-        # Add headers
         headers = ["Property", "Value"]
-        for col, header in enumerate(headers, 1):
-            cell = sheet.cell(row=1, column=col, value=header)
-            self._apply_header_style(cell)
+        rows = [
+            [prop.get("property", ""), str(prop.get("value", ""))]
+            for prop in custom_properties
+        ]
+        self._write_sheet(workbook, "Custom Properties", headers, rows)
+
+    def _write_sheet(
+        self,
+        workbook: Workbook,
+        title: str,
+        headers: List[str],
+        rows: List[List[Any]],
+    ) -> None:
+        """Append a styled header row and data rows to a new worksheet.
 
-        # Add custom properties data
-        for row, prop in enumerate(custom_properties, 2):
-            sheet.cell(row=row, column=1, value=prop.get("property", ""))
-            sheet.cell(row=row, column=2, value=str(prop.get("value", "")))
+        Rows are appended in order, which is the only way to fill a write-only
+        worksheet, and column widths are sized up front because write-only
+        sheets emit their column definitions before the first row.
+        """
+        sheet = workbook.create_sheet(title)
+        self._auto_adjust_columns(sheet, [headers, *rows])
 
-        self._auto_adjust_columns(sheet)
+        sheet.append([self._header_cell(sheet, header) for header in headers])
+        for row in rows:
+            sheet.append(row)
+
+    def _write_placeholder_sheet(
+        self, workbook: Workbook, title: str, message: str
+    ) -> None:
+        """Create a worksheet holding a single message for empty sections."""
+        sheet = workbook.create_sheet(title)
+        sheet.append([message])
+
+    def _header_cell(self, sheet, value: str) -> Cell:
+        """Create a header cell with header styling applied."""
+        cell = WriteOnlyCell(sheet, value=value)
+        self._apply_header_style(cell)
+        return cell
 
     def _apply_header_style(self, cell) -> None:
         """Apply header styling to a cell."""
@@ -767,18 +730,14 @@ class ODCSToExcelConverter:
         cell.fill = self.style_config["header_fill"]
         cell.alignment = self.style_config["alignment"]
 
-    def _auto_adjust_columns(self, sheet) -> None:
-        """Auto-adjust column widths."""
-        for column in sheet.columns:
-            max_length = 0
-            column_letter = get_column_letter(column[0].column)
-
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except Exception:
-                    pass
+    def _auto_adjust_columns(self, sheet, rows: List[List[Any]]) -> None:
+        """Auto-adjust column widths to fit the given rows."""
+        max_lengths: Dict[int, int] = {}
+        for row in rows:
+            for col, value in enumerate(row, 1):
+                length = len(str(value)) if value is not None else 0
+                max_lengths[col] = max(max_lengths.get(col, 0), length)
 
+        for col, max_length in max_lengths.items():
             adjusted_width = min(max_length + 2, 50)  # Cap at 50 characters
-            sheet.column_dimensions[column_letter].width = adjusted_width
+            sheet.column_dimensions[get_column_letter(col)].width = adjusted_width
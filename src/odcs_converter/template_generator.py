@@ -1,7 +1,8 @@
 """Template generator for creating sample Excel templates with field indicators."""
 
+import io
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from typing import BinaryIO, Dict, Any, List, Optional, Union
 from enum import Enum
 
 from openpyxl import Workbook
@@ -55,19 +56,21 @@ class TemplateGenerator:
 
     def generate_template(
         self,
-        output_path: Union[str, Path],
+        output_path: Union[str, Path, BinaryIO],
         template_type: TemplateType = TemplateType.FULL,
         include_examples: bool = True,
     ) -> None:
         """Generate Excel template based on specified type.
 
         Args:
-            output_path: Path to save the template
+            output_path: Path to save the template, or a binary file-like
+                object to write the workbook to
             template_type: Type of template to generate
             include_examples: Whether to include example values
         """
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        if not hasattr(output_path, "write"):
+            output_path = Path(output_path)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
 
         workbook = Workbook()
         workbook.remove(workbook.active)
@@ -86,6 +89,24 @@ class TemplateGenerator:
         workbook.save(output_path)
         logger.info(f"Template generated successfully: {output_path}")
 
+    def generate_template_to_buffer(
+        self,
+        template_type: TemplateType = TemplateType.FULL,
+        include_examples: bool = True,
+    ) -> bytes:
+        """Generate an Excel template in memory.
+
+        Args:
+            template_type: Type of template to generate
+            include_examples: Whether to include example values
+
+        Returns:
+            Contents of the generated .xlsx file
+        """
+        buffer = io.BytesIO()
+        self.generate_template(buffer, template_type, include_examples)
+        return buffer.getvalue()
+
     def _create_instructions_sheet(
         self, workbook: Workbook, template_type: TemplateType
     ) -> None:
@@ -11,9 +11,23 @@ logger = get_logger(__name__)
 performance_tracker = PerformanceTracker()
 
 
+try:
+    # The libyaml-backed loader parses several times faster
+    _YAML_LOADER = yaml.CSafeLoader
+except AttributeError:  # Optional: PyYAML built without libyaml
+    _YAML_LOADER = yaml.SafeLoader
+
+# Writing stays on the pure-Python emitter: libyaml escapes characters
+# outside the Basic Multilingual Plane (e.g. emoji) even with allow_unicode
+_YAML_DUMPER = yaml.Dumper
+
+
 class YAMLConverter:
     """Convert between ODCS dictionary and YAML format."""
 
+    _loader = _YAML_LOADER
+    _dumper = _YAML_DUMPER
+
     @staticmethod
     def dict_to_yaml(data: Dict[str, Any], output_path: Union[str, Path]) -> None:
         """Convert ODCS dictionary to YAML file.
@@ -36,6 +50,7 @@ class YAMLConverter:
                 yaml.dump(
                     data,
                     f,
+                    Dumper=YAMLConverter._dumper,
                     default_flow_style=False,
                     sort_keys=False,
                     indent=2,
@@ -70,7 +85,7 @@ class YAMLConverter:
 
         try:
             with open(yaml_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=YAMLConverter._loader)
 
             if not isinstance(data, dict):
                 raise ValueError(
@@ -103,6 +118,7 @@ class YAMLConverter:
         try:
             return yaml.dump(
                 data,
+                Dumper=YAMLConverter._dumper,
                 default_flow_style=False,
                 sort_keys=False,
                 indent=2,
@@ -127,7 +143,7 @@ class YAMLConverter:
             ValueError: If YAML string is invalid
         """
         try:
-            data = yaml.safe_load(yaml_string)
+            data = yaml.load(yaml_string, Loader=YAMLConverter._loader)
 
             if not isinstance(data, dict):
                 raise ValueError(
@@ -1,14 +1,22 @@
 """Pytest configuration and shared fixtures for ODCS Converter tests."""
 
+import copy
+import hashlib
 import json
+import os
 import tempfile
 from pathlib import Path
-from typing import Dict, Any, Generator
+from typing import Dict, Any, Generator, Iterable, Sequence
 from unittest.mock import MagicMock
 
 import pytest
 from openpyxl import Workbook
 
+try:
+    import xlsxwriter
+except ImportError:  # Optional test dependency, see the "test" extra
+    xlsxwriter = None
+
 from odcs_converter.generator import ODCSToExcelConverter
 from odcs_converter.excel_parser import ExcelToODCSParser
 from odcs_converter.yaml_converter import YAMLConverter
@@ -21,6 +29,10 @@ __all__ = [
     "validation_helper",
     "file_helper",
     "parameterized_test_data",
+    "cli_runner",
+    "cli_json_file",
+    "cli_excel_file",
+    "cli_config_file",
     "integration_test_helper",
     "excel_test_helper",
     "conversion_test_helper",
@@ -28,6 +40,8 @@ __all__ = [
     "workflow_test_helper",
     "complete_odcs_data",
     "multi_table_odcs_data",
+    "integration_excel_file",
+    "invalid_excel_file",
     "e2e_test_helper",
     "cli_test_helper",
     "performance_test_helper",
@@ -44,6 +58,10 @@ try:
         validation_helper,
         file_helper,
         parameterized_test_data,
+        cli_runner,
+        cli_json_file,
+        cli_excel_file,
+        cli_config_file,
     )
 except ImportError:
     pass
@@ -57,6 +75,8 @@ try:
         workflow_test_helper,
         complete_odcs_data,
         multi_table_odcs_data,
+        integration_excel_file,
+        invalid_excel_file,
     )
 except ImportError:
     pass
@@ -81,6 +101,13 @@ TEST_DATA_DIR = TESTS_DIR / "test_data"
 FIXTURES_DIR = TESTS_DIR / "fixtures"
 OUTPUTS_DIR = TESTS_DIR / "outputs"
 
+# RAM-backed mount used for tmp_path and tempfile when RAM_TMPDIR_ENV=1
+RAM_TMPDIR = Path("/dev/shm")
+RAM_TMPDIR_ENV = "ODCS_TEST_RAM_TMPDIR"
+
+# TMPDIR and tempfile.tempdir from before _prefer_ram_tmpdir changed them
+_saved_tmpdir = None
+
 # Ensure output directories exist
 for output_dir in [
     OUTPUTS_DIR / "unit",
@@ -127,9 +154,8 @@ def sample_odcs_minimal() -> Dict[str, Any]:
     }
 
 
-@pytest.fixture
-def sample_odcs_complete() -> Dict[str, Any]:
-    """Complete ODCS contract with all fields for testing."""
+def _sample_odcs_complete_data() -> Dict[str, Any]:
+    """Build the complete ODCS contract shared by fixtures."""
     return {
         "version": "2.0.0",
         "kind": "DataContract",
@@ -249,6 +275,12 @@ def sample_odcs_complete() -> Dict[str, Any]:
     }
 
 
+@pytest.fixture
+def sample_odcs_complete() -> Dict[str, Any]:
+    """Complete ODCS contract with all fields for testing."""
+    return _sample_odcs_complete_data()
+
+
 @pytest.fixture
 def odcs_to_excel_converter() -> ODCSToExcelConverter:
     """ODCSToExcelConverter instance for testing."""
@@ -264,42 +296,27 @@ def excel_to_odcs_parser() -> ExcelToODCSParser:
 @pytest.fixture
 def sample_excel_workbook() -> Generator[str, None, None]:
     """Create a sample Excel workbook for testing."""
-    wb = Workbook()
-    wb.remove(wb.active)  # Remove default sheet
-
-    # Basic Information sheet
-    basic_sheet = wb.create_sheet("Basic Information")
-    basic_data = [
-        ["Field", "Value", "Description"],
-        ["version", "1.0.0", "Contract Version"],
-        ["kind", "DataContract", "Contract Kind"],
-        ["apiVersion", "v3.0.2", "API Version"],
-        ["id", "test-workbook-001", "Unique ID"],
-        ["status", "active", "Status"],
-    ]
-    for row in basic_data:
-        basic_sheet.append(row)
-
-    # Tags sheet
-    tags_sheet = wb.create_sheet("Tags")
-    tags_sheet.append(["Tag"])
-    for tag in ["test", "sample", "workbook"]:
-        tags_sheet.append([tag])
-
-    # Description sheet
-    desc_sheet = wb.create_sheet("Description")
-    desc_data = [
-        ["Field", "Value"],
-        ["usage", "Sample workbook for testing"],
-        ["purpose", "Automated test validation"],
-    ]
-    for row in desc_data:
-        desc_sheet.append(row)
+    sheets = {
+        "Basic Information": [
+            ["Field", "Value", "Description"],
+            ["version", "1.0.0", "Contract Version"],
+            ["kind", "DataContract", "Contract Kind"],
+            ["apiVersion", "v3.0.2", "API Version"],
+            ["id", "test-workbook-001", "Unique ID"],
+            ["status", "active", "Status"],
+        ],
+        "Tags": [["Tag"]] + [[tag] for tag in ["test", "sample", "workbook"]],
+        "Description": [
+            ["Field", "Value"],
+            ["usage", "Sample workbook for testing"],
+            ["purpose", "Automated test validation"],
+        ],
+    }
 
     # Save to temporary file
     with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp_file:
-        wb.save(tmp_file.name)
         tmp_path = tmp_file.name
+    write_xlsx(Path(tmp_path), sheets)
 
     yield tmp_path
 
@@ -378,9 +395,129 @@ def excel_file_factory(temp_dir):
     return _create_excel_file
 
 
+def write_xlsx(file_path: Path, sheets: Dict[str, Iterable[Sequence[Any]]]) -> Path:
+    """Write worksheet rows to an Excel file in one pass.
+
+    Uses xlsxwriter in constant-memory mode when it is installed, falling back
+    to an openpyxl write-only workbook. Either way rows are streamed to disk
+    instead of being materialized as cell objects, and may be given as a
+    generator so large sheets never need to be held in memory.
+    """
+    if xlsxwriter is None:
+        wb = Workbook(write_only=True)
+        for sheet_name, rows in sheets.items():
+            append = wb.create_sheet(sheet_name).append
+            for row in rows:
+                append(row)
+        wb.save(file_path)
+        return file_path
+
+    # strings_to_numbers stays off so "5432" is kept as a string cell
+    wb = xlsxwriter.Workbook(
+        str(file_path), {"constant_memory": True, "strings_to_numbers": False}
+    )
+    for sheet_name, rows in sheets.items():
+        write_row = wb.add_worksheet(sheet_name).write_row
+        for row_index, row in enumerate(rows):
+            write_row(row_index, 0, row)
+    wb.close()
+    return file_path
+
+
+@pytest.fixture
+def make_xlsx():
+    """Factory to write worksheet rows to an Excel file, see write_xlsx."""
+    return write_xlsx
+
+
+class ParsedExcelCache:
+    """Session cache of ODCS payloads rendered to Excel and parsed back.
+
+    Fixture payloads never change within a session, so each distinct payload
+    is written to xlsx and parsed at most once. Parsed results are deep-copied
+    on the way out so tests cannot leak mutations into each other.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+        self._excel_files: Dict[str, Path] = {}
+        self._parsed: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def _key(data: Dict[str, Any]) -> str:
+        payload = json.dumps(data, sort_keys=True, default=str)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def excel_file(self, data: Dict[str, Any]) -> Path:
+        """Get the Excel file generated from data, creating it on first use."""
+        key = self._key(data)
+        if key not in self._excel_files:
+            file_path = self.cache_dir / f"{key}.xlsx"
+            ODCSToExcelConverter().generate_from_dict(data, file_path)
+            self._excel_files[key] = file_path
+        return self._excel_files[key]
+
+    def parse(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Get data as parsed back from its generated Excel file."""
+        key = self._key(data)
+        if key not in self._parsed:
+            excel_file = self.excel_file(data)
+            self._parsed[key] = ExcelToODCSParser().parse_from_file(excel_file)
+        return copy.deepcopy(self._parsed[key])
+
+
+@pytest.fixture(scope="session")
+def parsed_excel_cache(tmp_path_factory) -> ParsedExcelCache:
+    """Session-wide cache of generated and parsed Excel workbooks."""
+    return ParsedExcelCache(tmp_path_factory.mktemp("excel_cache"))
+
+
+@pytest.fixture(scope="session")
+def sample_complete_xlsx(parsed_excel_cache) -> Path:
+    """Excel file generated once per session from the complete ODCS contract.
+
+    The file is shared between tests and must be treated as read-only; copy it
+    into ``temp_dir`` before modifying it.
+    """
+    return parsed_excel_cache.excel_file(_sample_odcs_complete_data())
+
+
+# Opt-in RAM-backed temp directory
+def _prefer_ram_tmpdir() -> None:
+    """Send temporary files to RAM_TMPDIR when RAM_TMPDIR_ENV is set to 1.
+
+    Runs before pytest creates its base temp directory, so tmp_path,
+    tempfile and CLI subprocesses all write workbooks to memory. The previous
+    TMPDIR is put back by _restore_tmpdir.
+    """
+    global _saved_tmpdir
+    if os.environ.get(RAM_TMPDIR_ENV) != "1" or os.environ.get("PYTEST_DEBUG_TEMPROOT"):
+        return
+    if not (RAM_TMPDIR.is_dir() and os.access(RAM_TMPDIR, os.W_OK)):
+        return
+    _saved_tmpdir = (os.environ.get("TMPDIR"), tempfile.tempdir)
+    os.environ["TMPDIR"] = str(RAM_TMPDIR)
+    tempfile.tempdir = None  # drop the cached gettempdir() result
+
+
+def _restore_tmpdir() -> None:
+    """Undo _prefer_ram_tmpdir for whatever runs after the test session."""
+    global _saved_tmpdir
+    if _saved_tmpdir is None:
+        return
+    previous_env, previous_tempdir = _saved_tmpdir
+    if previous_env is None:
+        os.environ.pop("TMPDIR", None)
+    else:
+        os.environ["TMPDIR"] = previous_env
+    tempfile.tempdir = previous_tempdir
+    _saved_tmpdir = None
+
+
 # Test markers for different test categories
 def pytest_configure(config):
-    """Register custom pytest markers."""
+    """Register custom pytest markers and pick the temp directory."""
+    _prefer_ram_tmpdir()
     config.addinivalue_line(
         "markers", "unit: marks tests as unit tests (fast, isolated)"
     )
@@ -392,6 +529,15 @@ def pytest_configure(config):
         "markers", "e2e: marks tests as end-to-end tests (slower, full workflow)"
     )
     config.addinivalue_line("markers", "slow: marks tests as slow running")
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): keeps tests on one pytest-xdist worker (--dist loadgroup)",
+    )
+
+
+def pytest_unconfigure(config):
+    """Restore the temp directory chosen in pytest_configure."""
+    _restore_tmpdir()
 
 
 # Custom test result handling
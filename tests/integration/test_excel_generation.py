@@ -1,10 +1,28 @@
 """Integration tests for Excel generation workflows."""
 
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 from odcs_converter.generator import ODCSToExcelConverter
 from odcs_converter.yaml_converter import YAMLConverter
+from tests.integration.utils import assert_sheets, stub_requests_get
+
+# Sheets generated for a complete ODCS contract
+_EXPECTED_COMPLETE_SHEETS = frozenset(
+    {
+        "Basic Information",
+        "Tags",
+        "Description",
+        "Servers",
+        "Schema",
+        "Support",
+        "Team",
+        "Roles",
+        "SLA Properties",
+        "Authoritative Definitions",
+        "Custom Properties",
+    }
+)
 
 
 @pytest.mark.integration
@@ -32,22 +50,7 @@ class TestExcelGenerationWorkflow:
 
         workbook = load_workbook(excel_file)
 
-        expected_sheets = [
-            "Basic Information",
-            "Tags",
-            "Description",
-            "Servers",
-            "Schema",
-            "Support",
-            "Team",
-            "Roles",
-            "SLA Properties",
-            "Authoritative Definitions",
-            "Custom Properties",
-        ]
-
-        for sheet_name in expected_sheets:
-            assert sheet_name in workbook.sheetnames
+        assert_sheets(workbook.sheetnames, _EXPECTED_COMPLETE_SHEETS)
 
         # Verify basic information sheet content
         basic_sheet = workbook["Basic Information"]
@@ -132,16 +135,11 @@ class TestExcelGenerationWorkflow:
         # Here we just verify the file was created with custom styling
         assert header_cell.value == "Field"
 
-    @patch("odcs_converter.generator.requests.get")
     def test_generate_excel_from_url_workflow(
-        self, mock_get, sample_odcs_complete, temp_dir
+        self, monkeypatch, sample_odcs_complete, temp_dir
     ):
         """Test workflow: URL -> Excel generation."""
-        # Setup mock response
-        mock_response = MagicMock()
-        mock_response.json.return_value = sample_odcs_complete
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        calls = stub_requests_get(monkeypatch, sample_odcs_complete)
 
         converter = ODCSToExcelConverter()
         excel_file = temp_dir / "url_to_excel.xlsx"
@@ -151,7 +149,7 @@ class TestExcelGenerationWorkflow:
         converter.generate_from_url(test_url, excel_file)
 
         # Verify
-        mock_get.assert_called_once_with(test_url, timeout=30)
+        assert calls == [(test_url, 30)]
         assert excel_file.exists()
 
         from openpyxl import load_workbook
@@ -217,8 +215,7 @@ class TestExcelGenerationWorkflow:
         from openpyxl import load_workbook
 
         workbook = load_workbook(excel_file)
-        assert "Basic Information" in workbook.sheetnames
-        assert "Servers" in workbook.sheetnames
+        assert_sheets(workbook.sheetnames, ["Basic Information", "Servers"])
 
     def test_concurrent_excel_generation(self, sample_odcs_complete, temp_dir):
         """Test concurrent Excel generation to ensure thread safety."""
@@ -1,14 +1,22 @@
 """Test cases specifically for Excel to ODCS parsing functionality."""
 
+import io
 import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
 import pytest
-from openpyxl import Workbook
 
-from odcs_converter.excel_parser import ExcelToODCSParser
+from odcs_converter.excel_parser import (
+    BULK_CONVERSION_THRESHOLD,
+    EXCEL_BACKEND_ENV_VAR,
+    PARSE_CACHE_ENV_VAR,
+    ExcelToODCSParser,
+    _convert_port,
+    _convert_port_column,
+    _parse_cached,
+)
 from odcs_converter.generator import ODCSToExcelConverter
 
 
@@ -21,15 +29,9 @@ class TestExcelToODCSParser:
         return ExcelToODCSParser()
 
     @pytest.fixture
-    def sample_excel_file(self):
+    def sample_excel_file(self, make_xlsx):
         """Create a sample Excel file for testing."""
-        wb = Workbook()
-
-        # Remove default sheet
-        wb.remove(wb.active)
-
         # Basic Information sheet
-        basic_sheet = wb.create_sheet("Basic Information")
         basic_data = [
             ["Field", "Value", "Description"],
             ["version", "1.0.0", "Contract Version"],
@@ -39,29 +41,19 @@ class TestExcelToODCSParser:
             ["status", "active", "Status"],
             ["name", "Test Contract", "Contract Name"],
         ]
-        for row in basic_data:
-            basic_sheet.append(row)
 
         # Tags sheet
-        tags_sheet = wb.create_sheet("Tags")
-        tags_sheet.append(["Tag"])
-        tags_sheet.append(["test"])
-        tags_sheet.append(["example"])
-        tags_sheet.append(["parser"])
+        tags_data = [["Tag"], ["test"], ["example"], ["parser"]]
 
         # Description sheet
-        desc_sheet = wb.create_sheet("Description")
         desc_data = [
             ["Field", "Value"],
             ["usage", "Test usage description"],
             ["purpose", "Testing Excel parser"],
             ["limitations", "Test environment only"],
         ]
-        for row in desc_data:
-            desc_sheet.append(row)
 
         # Servers sheet
-        servers_sheet = wb.create_sheet("Servers")
         servers_data = [
             [
                 "Server",
@@ -91,34 +83,36 @@ class TestExcelToODCSParser:
                 "PROD_DB",
             ],
         ]
-        for row in servers_data:
-            servers_sheet.append(row)
 
         # Team sheet
-        team_sheet = wb.create_sheet("Team")
         team_data = [
             ["Username", "Name", "Role", "Description"],
             ["test@example.com", "Test User", "owner", "Test team member"],
             ["dev@example.com", "Developer", "contributor", "Development team"],
         ]
-        for row in team_data:
-            team_sheet.append(row)
 
         # Custom Properties sheet
-        props_sheet = wb.create_sheet("Custom Properties")
         props_data = [
             ["Property", "Value"],
             ["environment", "test"],
             ["dataRetentionDays", "365"],
             ["isActive", "true"],
         ]
-        for row in props_data:
-            props_sheet.append(row)
 
         # Save to temporary file
         temp_file = tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False)
-        wb.save(temp_file.name)
-        wb.close()
+        temp_file.close()
+        make_xlsx(
+            Path(temp_file.name),
+            {
+                "Basic Information": basic_data,
+                "Tags": tags_data,
+                "Description": desc_data,
+                "Servers": servers_data,
+                "Team": team_data,
+                "Custom Properties": props_data,
+            },
+        )
 
         return temp_file.name
 
@@ -206,6 +200,84 @@ class TestExcelToODCSParser:
         finally:
             Path(sample_excel_file).unlink(missing_ok=True)
 
+    def test_openpyxl_backend_matches_default(
+        self, parser, sample_excel_file, monkeypatch
+    ):
+        """Test forcing the openpyxl backend yields the same parsed data."""
+        try:
+            default_result = parser.parse_from_file(sample_excel_file)
+
+            monkeypatch.setenv(EXCEL_BACKEND_ENV_VAR, "openpyxl")
+            openpyxl_result = ExcelToODCSParser().parse_from_file(sample_excel_file)
+
+            assert openpyxl_result == default_result
+        finally:
+            Path(sample_excel_file).unlink(missing_ok=True)
+
+    @pytest.mark.parametrize("backend", ["calamine", "openpyxl"])
+    def test_parse_from_file_object(self, backend, sample_complete_xlsx, monkeypatch):
+        """Test parsing from a binary stream matches parsing from a path."""
+        if backend == "calamine":
+            pytest.importorskip("python_calamine")
+        monkeypatch.setenv(EXCEL_BACKEND_ENV_VAR, backend)
+
+        path_result = ExcelToODCSParser().parse_from_file(sample_complete_xlsx)
+        stream = io.BytesIO(sample_complete_xlsx.read_bytes())
+        stream_result = ExcelToODCSParser().parse_from_file(stream)
+
+        # Compare reprs since empty ports parse to NaN, which never equals itself
+        assert repr(stream_result) == repr(path_result)
+
+    def test_parse_from_buffer_roundtrip(self, sample_odcs_complete):
+        """Test an in-memory workbook parses back without touching disk."""
+        excel_bytes = ODCSToExcelConverter().generate_to_buffer(sample_odcs_complete)
+        result = ExcelToODCSParser().parse_from_buffer(excel_bytes)
+
+        assert excel_bytes[:2] == b"PK"
+        assert result["id"] == sample_odcs_complete["id"]
+        assert result["tags"] == sample_odcs_complete["tags"]
+
+    def test_parse_cache_reuses_unchanged_file(self, tmp_path, make_xlsx, monkeypatch):
+        """Test the opt-in parse cache serves copies until the file changes."""
+        monkeypatch.setenv(PARSE_CACHE_ENV_VAR, "1")
+        _parse_cached.cache_clear()
+        excel_path = tmp_path / "cached.xlsx"
+        make_xlsx(excel_path, {"Tags": [["Tag"], ["first"]]})
+
+        first = ExcelToODCSParser().parse_from_file(excel_path)
+        first["tags"].append("mutated")
+        second = ExcelToODCSParser().parse_from_file(excel_path)
+
+        assert second["tags"] == ["first"]
+        assert _parse_cached.cache_info().hits == 1
+
+        make_xlsx(excel_path, {"Tags": [["Tag"], ["first"], ["second"]]})
+        assert ExcelToODCSParser().parse_from_file(excel_path)["tags"] == [
+            "first",
+            "second",
+        ]
+        _parse_cached.cache_clear()
+
+    def test_unused_worksheets_are_not_loaded(
+        self, parser, tmp_path, make_xlsx, monkeypatch
+    ):
+        """Test worksheets no section parser reads are never loaded."""
+        monkeypatch.delenv(PARSE_CACHE_ENV_VAR, raising=False)
+        excel_path = make_xlsx(
+            tmp_path / "with_notes.xlsx",
+            {"Notes": [["Free-form", "notes"]], "Tags": [["Tag"], ["lazy"]]},
+        )
+
+        with patch.object(
+            parser, "_load_worksheet", wraps=parser._load_worksheet
+        ) as load_worksheet:
+            result = parser.parse_from_file(excel_path)
+
+        assert result["tags"] == ["lazy"]
+        loaded_sheets = [call.args[0] for call in load_worksheet.call_args_list]
+        assert loaded_sheets == ["Tags"]
+        assert set(parser.worksheets) == {"Tags"}
+
     def test_parse_file_not_found(self, parser):
         """Test handling of non-existent Excel file."""
         with pytest.raises(FileNotFoundError):
@@ -394,7 +466,9 @@ class TestExcelToODCSParser:
             ]
         )
 
-        parser.worksheets = {"Servers": servers_df}
+        parser.worksheets = {
+            "Servers": parser._apply_column_converters("Servers", servers_df)
+        }
 
         result = parser._parse_servers()
 
@@ -407,6 +481,17 @@ class TestExcelToODCSParser:
         # Second server should have port as string (conversion failed)
         assert servers[1]["port"] == "invalid_port"
 
+    def test_port_column_bulk_matches_scalar_conversion(self):
+        """Test vectorized port column conversion agrees with _convert_port."""
+        samples = ["5432", " 3306 ", "invalid_port", "+80", 8080, 443.0, None, ""]
+        values = samples * (BULK_CONVERSION_THRESHOLD // len(samples) + 1)
+
+        converted = _convert_port_column(values)
+
+        expected = [None if v is None else _convert_port(v) for v in values]
+        assert converted == expected
+        assert [type(v) for v in converted] == [type(v) for v in expected]
+
     def test_parse_custom_properties_with_type_conversion(self, parser):
         """Test custom properties parsing with automatic type conversion."""
         # Mock DataFrame with various value types
@@ -444,6 +529,17 @@ class TestExcelToODCSParser:
         bool_prop = next(p for p in props if p["property"] == "boolProp")
         assert bool_prop["value"]
 
+    def test_convert_values_bulk_matches_scalar_conversion(self, parser):
+        """Test vectorized column conversion agrees with _convert_value."""
+        samples = ["hello", "42", "3.14", "TRUE", "false", "", None, 7, 2.5, "1.2.3"]
+        values = samples * (BULK_CONVERSION_THRESHOLD // len(samples) + 1)
+
+        converted = parser._convert_values(values)
+
+        expected = [parser._convert_value(value) for value in values]
+        assert converted == expected
+        assert [type(v) for v in converted] == [type(v) for v in expected]
+
     def test_integration_with_generated_excel(self, parser):
         """Test parsing Excel file generated by ODCSToExcelConverter."""
         # Original ODCS data
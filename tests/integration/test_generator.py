@@ -1,22 +1,48 @@
 """Tests for ODCS Converter - bidirectional conversion between ODCS and Excel."""
 
-import json
-import tempfile
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
+import orjson
 import pytest
 from openpyxl import load_workbook
 
 from odcs_converter.generator import ODCSToExcelConverter
 from odcs_converter.excel_parser import ExcelToODCSParser
 from odcs_converter.yaml_converter import YAMLConverter
+from tests.integration.utils import (
+    assert_sheets,
+    read_sheet_names,
+    stub_requests_get,
+)
+
+# Sheets generated for the basic sample contract
+_EXPECTED_BASIC_SHEETS = frozenset(
+    {"Basic Information", "Tags", "Description", "Servers", "Team"}
+)
+
+# Writer and reader for each ODCS text format covered by the roundtrip test
+_ROUNDTRIP_FORMATS = {
+    "json": (
+        lambda data, path: path.write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        ),
+        lambda path: orjson.loads(path.read_bytes()),
+    ),
+    "yaml": (YAMLConverter.dict_to_yaml, YAMLConverter.yaml_to_dict),
+}
+
+
+@pytest.fixture(scope="class")
+def converter():
+    """Create one ODCSToExcelConverter shared by the tests in a class."""
+    return ODCSToExcelConverter()
 
 
 class TestODCSToExcelConverter:
     """Test cases for ODCS to Excel conversion."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_odcs_data(self):
         """Sample ODCS data for testing."""
         return {
@@ -40,77 +66,66 @@ class TestODCSToExcelConverter:
             ],
         }
 
-    @pytest.fixture
-    def converter(self):
-        """Create ODCSToExcelConverter instance."""
-        return ODCSToExcelConverter()
+    @pytest.fixture(scope="session")
+    def prebuilt_xlsx(self, tmp_path_factory, sample_odcs_data):
+        """Workbook generated once from sample_odcs_data for structure checks."""
+        output_path = tmp_path_factory.mktemp("xlsx") / "contract.xlsx"
+        ODCSToExcelConverter().generate_from_dict(sample_odcs_data, output_path)
+        return output_path
 
-    def test_generate_from_dict(self, converter, sample_odcs_data):
+    def test_generate_from_dict(self, prebuilt_xlsx):
         """Test generating Excel from ODCS dictionary."""
-        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp_file:
-            output_path = tmp_file.name
-
-        try:
-            converter.generate_from_dict(sample_odcs_data, output_path)
+        # Verify file was created
+        assert prebuilt_xlsx.exists()
 
-            # Verify file was created
-            assert Path(output_path).exists()
+        # Verify Excel structure
+        sheet_names = read_sheet_names(prebuilt_xlsx)
+        assert_sheets(sheet_names, _EXPECTED_BASIC_SHEETS)
 
-            # Verify Excel structure
-            workbook = load_workbook(output_path)
-            expected_sheets = [
-                "Basic Information",
-                "Tags",
-                "Description",
-                "Servers",
-                "Team",
-            ]
+    def test_write_only_matches_standard_workbook(self, sample_odcs_data, tmp_path):
+        """Test write-only generation produces the same cells and widths."""
+        write_only_path = tmp_path / "write_only.xlsx"
+        standard_path = tmp_path / "standard.xlsx"
 
-            for sheet_name in expected_sheets:
-                assert sheet_name in workbook.sheetnames
+        ODCSToExcelConverter().generate_from_dict(sample_odcs_data, write_only_path)
+        ODCSToExcelConverter(write_only=False).generate_from_dict(
+            sample_odcs_data, standard_path
+        )
 
-        finally:
-            Path(output_path).unlink(missing_ok=True)
+        write_only_wb = load_workbook(write_only_path)
+        standard_wb = load_workbook(standard_path)
+        assert write_only_wb.sheetnames == standard_wb.sheetnames
+
+        for sheet_name in standard_wb.sheetnames:
+            write_only_sheet = write_only_wb[sheet_name]
+            standard_sheet = standard_wb[sheet_name]
+            assert list(write_only_sheet.values) == list(standard_sheet.values)
+            assert write_only_sheet["A1"].font.bold == standard_sheet["A1"].font.bold
+            assert (
+                write_only_sheet.column_dimensions["A"].width
+                == standard_sheet.column_dimensions["A"].width
+            )
 
-    def test_generate_from_file(self, converter, sample_odcs_data):
+    def test_generate_from_file(self, converter, sample_odcs_data, tmp_path):
         """Test generating Excel from JSON file."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".json", delete=False
-        ) as json_file:
-            json.dump(sample_odcs_data, json_file)
-            json_file_path = json_file.name
-
-        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as excel_file:
-            excel_file_path = excel_file.name
+        json_file_path = tmp_path / "contract.json"
+        json_file_path.write_bytes(orjson.dumps(sample_odcs_data))
+        excel_file_path = tmp_path / "out.xlsx"
 
-        try:
-            converter.generate_from_file(json_file_path, excel_file_path)
-            assert Path(excel_file_path).exists()
+        converter.generate_from_file(json_file_path, excel_file_path)
+        assert excel_file_path.exists()
 
-        finally:
-            Path(json_file_path).unlink(missing_ok=True)
-            Path(excel_file_path).unlink(missing_ok=True)
-
-    @patch("requests.get")
-    def test_generate_from_url(self, mock_get, converter, sample_odcs_data):
+    def test_generate_from_url(
+        self, monkeypatch, converter, sample_odcs_data, tmp_path
+    ):
         """Test generating Excel from URL."""
-        # Mock HTTP response
-        mock_response = MagicMock()
-        mock_response.json.return_value = sample_odcs_data
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
-
-        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp_file:
-            output_path = tmp_file.name
-
-        try:
-            converter.generate_from_url(
-                "https://example.com/contract.json", output_path
-            )
-            assert Path(output_path).exists()
+        calls = stub_requests_get(monkeypatch, sample_odcs_data)
+        url = "https://example.com/contract.json"
 
-        finally:
-            Path(output_path).unlink(missing_ok=True)
+        output_path = tmp_path / "out.xlsx"
+        converter.generate_from_url(url, output_path)
+        assert calls == [(url, 30)]
+        assert output_path.exists()
 
     def test_file_not_found_error(self, converter):
         """Test handling of missing input file."""
@@ -157,6 +172,9 @@ class TestExcelToODCSParser:
         assert parser._convert_value("text") == "text"
         assert parser._convert_value("") is None
         assert parser._convert_value(None) is None
+        assert parser._convert_values(
+            ["true", "false", "123", "123.45", "text", "", None]
+        ) == [True, False, 123, 123.45, "text", None, None]
 
     def test_clean_data(self, parser):
         """Test data cleaning functionality."""
@@ -212,7 +230,7 @@ class TestExcelToODCSParser:
 class TestYAMLConverter:
     """Test cases for YAML conversion utilities."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_data(self):
         """Sample data for YAML conversion."""
         return {
@@ -223,40 +241,36 @@ class TestYAMLConverter:
             "tags": ["test", "yaml"],
         }
 
-    def test_dict_to_yaml_string(self, sample_data):
+    @pytest.fixture(scope="session")
+    def sample_yaml_string(self, sample_data):
+        """sample_data serialized once to YAML."""
+        return YAMLConverter.dict_to_yaml_string(sample_data)
+
+    def test_dict_to_yaml_string(self, sample_yaml_string):
         """Test converting dictionary to YAML string."""
-        yaml_string = YAMLConverter.dict_to_yaml_string(sample_data)
+        yaml_string = sample_yaml_string
 
         assert "version: 1.0.0" in yaml_string
         assert "kind: DataContract" in yaml_string
         assert "- test" in yaml_string
         assert "- yaml" in yaml_string
 
-    def test_yaml_string_to_dict(self, sample_data):
+    def test_yaml_string_to_dict(self, sample_data, sample_yaml_string):
         """Test converting YAML string to dictionary."""
-        yaml_string = YAMLConverter.dict_to_yaml_string(sample_data)
-        converted_data = YAMLConverter.yaml_string_to_dict(yaml_string)
+        converted_data = YAMLConverter.yaml_string_to_dict(sample_yaml_string)
 
         assert converted_data == sample_data
 
-    def test_dict_to_yaml_file(self, sample_data):
+    def test_dict_to_yaml_file(self, sample_data, tmp_path):
         """Test converting dictionary to YAML file."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".yaml", delete=False
-        ) as tmp_file:
-            yaml_file_path = tmp_file.name
-
-        try:
-            YAMLConverter.dict_to_yaml(sample_data, yaml_file_path)
-
-            assert Path(yaml_file_path).exists()
+        yaml_file_path = tmp_path / "out.yaml"
+        YAMLConverter.dict_to_yaml(sample_data, yaml_file_path)
 
-            # Read back and verify
-            loaded_data = YAMLConverter.yaml_to_dict(yaml_file_path)
-            assert loaded_data == sample_data
+        assert yaml_file_path.exists()
 
-        finally:
-            Path(yaml_file_path).unlink(missing_ok=True)
+        # Read back and verify
+        loaded_data = YAMLConverter.yaml_to_dict(yaml_file_path)
+        assert loaded_data == sample_data
 
     def test_yaml_to_dict_file_not_found(self):
         """Test handling of missing YAML file."""
@@ -292,7 +306,7 @@ class TestYAMLConverter:
 class TestIntegrationBidirectional:
     """Integration tests for bidirectional conversion."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_odcs_data(self):
         """Complete ODCS sample data."""
         return {
@@ -327,91 +341,39 @@ class TestIntegrationBidirectional:
             "customProperties": [{"property": "testProperty", "value": "testValue"}],
         }
 
-    def test_odcs_to_excel_to_odcs_roundtrip_json(self, sample_odcs_data):
-        """Test complete roundtrip: ODCS JSON → Excel → ODCS JSON."""
-        # Create temporary files
-        json_input = tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False)
-        excel_temp = tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False)
-        json_output = tempfile.NamedTemporaryFile(
-            mode="w", suffix=".json", delete=False
-        )
-
-        try:
-            # Step 1: Write original ODCS data
-            json.dump(sample_odcs_data, json_input)
-            json_input.close()
-
-            # Step 2: Convert ODCS → Excel
-            converter = ODCSToExcelConverter()
-            converter.generate_from_file(json_input.name, excel_temp.name)
-
-            # Verify Excel file exists and has expected structure
-            assert Path(excel_temp.name).exists()
-            workbook = load_workbook(excel_temp.name)
-            assert "Basic Information" in workbook.sheetnames
-            assert "Tags" in workbook.sheetnames
-            assert "Team" in workbook.sheetnames
-
-            # Step 3: Convert Excel → ODCS
-            parser = ExcelToODCSParser()
-            parsed_data = parser.parse_from_file(excel_temp.name)
-
-            # Step 4: Write parsed data
-            json_output.close()
-            with open(json_output.name, "w") as f:
-                json.dump(parsed_data, f, indent=2)
-
-            # Step 5: Verify essential data integrity
-            assert parsed_data.get("version") == sample_odcs_data["version"]
-            assert parsed_data.get("kind") == sample_odcs_data["kind"]
-            assert parsed_data.get("id") == sample_odcs_data["id"]
-            assert parsed_data.get("status") == sample_odcs_data["status"]
-
-            # Verify tags are preserved (order might differ)
-            if "tags" in parsed_data:
-                assert set(parsed_data["tags"]) == set(sample_odcs_data["tags"])
-
-        finally:
-            # Cleanup
-            Path(json_input.name).unlink(missing_ok=True)
-            Path(excel_temp.name).unlink(missing_ok=True)
-            Path(json_output.name).unlink(missing_ok=True)
-
-    def test_odcs_to_excel_to_odcs_roundtrip_yaml(self, sample_odcs_data):
-        """Test complete roundtrip: ODCS YAML → Excel → ODCS YAML."""
-        # Create temporary files
-        yaml_input = tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False)
-        excel_temp = tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False)
-        yaml_output = tempfile.NamedTemporaryFile(
-            mode="w", suffix=".yaml", delete=False
-        )
-
-        try:
-            # Step 1: Write original ODCS data as YAML
-            yaml_input.close()
-            YAMLConverter.dict_to_yaml(sample_odcs_data, yaml_input.name)
-
-            # Step 2: Convert ODCS YAML → Excel
-            converter = ODCSToExcelConverter()
-            yaml_data = YAMLConverter.yaml_to_dict(yaml_input.name)
-            converter.generate_from_dict(yaml_data, excel_temp.name)
-
-            # Step 3: Convert Excel → ODCS YAML
-            parser = ExcelToODCSParser()
-            parsed_data = parser.parse_from_file(excel_temp.name)
-
-            yaml_output.close()
-            YAMLConverter.dict_to_yaml(parsed_data, yaml_output.name)
-
-            # Step 4: Verify data integrity
-            final_data = YAMLConverter.yaml_to_dict(yaml_output.name)
-
-            assert final_data.get("version") == sample_odcs_data["version"]
-            assert final_data.get("kind") == sample_odcs_data["kind"]
-            assert final_data.get("id") == sample_odcs_data["id"]
-
-        finally:
-            # Cleanup
-            Path(yaml_input.name).unlink(missing_ok=True)
-            Path(excel_temp.name).unlink(missing_ok=True)
-            Path(yaml_output.name).unlink(missing_ok=True)
+    @pytest.mark.parametrize("fmt", sorted(_ROUNDTRIP_FORMATS))
+    def test_odcs_to_excel_to_odcs_roundtrip(self, fmt, sample_odcs_data, tmp_path):
+        """Test complete roundtrip: ODCS JSON/YAML → Excel → ODCS JSON/YAML."""
+        write, read = _ROUNDTRIP_FORMATS[fmt]
+        source_path = tmp_path / f"input.{fmt}"
+        excel_path = tmp_path / "out.xlsx"
+        output_path = tmp_path / f"output.{fmt}"
+
+        # Step 1: Write original ODCS data
+        write(sample_odcs_data, source_path)
+
+        # Step 2: Convert ODCS → Excel
+        converter = ODCSToExcelConverter()
+        converter.generate_from_dict(read(source_path), excel_path)
+
+        # Verify Excel file exists and has expected structure
+        assert excel_path.exists()
+        sheet_names = read_sheet_names(excel_path)
+        assert_sheets(sheet_names, ["Basic Information", "Tags", "Team"])
+
+        # Step 3: Convert Excel → ODCS and write it back out
+        parser = ExcelToODCSParser()
+        parsed_data = parser.parse_from_file(excel_path)
+        write(parsed_data, output_path)
+
+        # Step 4: Verify essential data integrity of what was written
+        final_data = read(output_path)
+        assert final_data == parsed_data
+        assert final_data.get("version") == sample_odcs_data["version"]
+        assert final_data.get("kind") == sample_odcs_data["kind"]
+        assert final_data.get("id") == sample_odcs_data["id"]
+        assert final_data.get("status") == sample_odcs_data["status"]
+
+        # Verify tags are preserved (order might differ)
+        if "tags" in final_data:
+            assert sorted(final_data["tags"]) == sorted(sample_odcs_data["tags"])
@@ -5,367 +5,337 @@ This module tests the logging system integration with the CLI commands,
 ensuring proper logging behavior across different environments and scenarios.
 """
 
-import json
 import os
-import tempfile
+import statistics
 import time
 from pathlib import Path
-from unittest.mock import patch
+from typing import Dict, List, Optional, Tuple
+import orjson
 import pytest
+from click.testing import Result
 from typer.testing import CliRunner
 
 from odcs_converter.cli import app
+from odcs_converter.logging_config import get_logger
+
+_TEST_DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+# The CLI reconfigures the process-global loguru logger on every invocation.
+# monkeypatch keeps each test's environment isolated when tests run one after
+# another on the same worker, but not when they run in parallel, so pin this
+# module to a single worker under pytest-xdist's --dist loadgroup.
+pytestmark = pytest.mark.xdist_group("cli-logging")
+
+
+def _list_logs(log_dir: Path, suffix: str = ".log", contains: str = "") -> List[Path]:
+    """List files in log_dir whose names end with suffix and contain contains.
+
+    Uses a single os.scandir pass and returns [] when log_dir was never created.
+    """
+    if not log_dir.exists():
+        return []
+    return [
+        Path(entry.path)
+        for entry in os.scandir(log_dir)
+        if entry.is_file() and entry.name.endswith(suffix) and contains in entry.name
+    ]
+
+
+@pytest.fixture(scope="module")
+def runner():
+    """CLI runner shared by every test in the module."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_typer(tmp_path_factory):
+    """Build the Typer command tree once so no test pays for it on first call."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("ODCS_LOG_DIR", str(tmp_path_factory.mktemp("warmup_logs")))
+        CliRunner().invoke(app, ["--help"], catch_exceptions=False)
+
+
+@pytest.fixture
+def invoke(runner, tmp_path, monkeypatch):
+    """Invoke the CLI with ODCS_LOG_DIR pointed at a per-test log directory.
+
+    Returns a function taking the CLI arguments and optional extra environment
+    variables, which returns the CLI result and the log directory.
+    """
+    log_dir = tmp_path / "logs"
+
+    def _invoke(
+        args: List[str], env: Optional[Dict[str, str]] = None
+    ) -> Tuple[Result, Path]:
+        monkeypatch.setenv("ODCS_LOG_DIR", str(log_dir))
+        for name, value in (env or {}).items():
+            monkeypatch.setenv(name, value)
+        return runner.invoke(app, args, catch_exceptions=False), log_dir
+
+    return _invoke
+
+
+@pytest.fixture(scope="session")
+def sample_odcs_json() -> bytes:
+    """ODCS contract with sensitive-looking data, serialized once."""
+    test_data = {
+        "dataContractSpecification": "3.0.2",
+        "id": "test-contract",
+        "info": {
+            "title": "Test Contract",
+            "version": "1.0.0",
+            "description": "Test with password=secret123",
+        },
+    }
+    return orjson.dumps(test_data)
+
+
+@pytest.fixture(scope="session")
+def discovered_test_json() -> Optional[Path]:
+    """First JSON file in the shared test data directory, if any."""
+    if not _TEST_DATA_DIR.exists():
+        return None
+    return next(iter(sorted(_TEST_DATA_DIR.glob("*.json"))), None)
 
 
 class TestCLILoggingIntegration:
     """Integration tests for CLI logging."""
 
-    def setup_method(self):
-        """Set up test environment."""
-        self.runner = CliRunner()
-        self.test_data_dir = Path(__file__).parent.parent / "data"
-
-    def test_cli_logging_with_verbose_flag(self):
+    def test_cli_logging_with_verbose_flag(self, invoke):
         """Test CLI logging with verbose flag."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_dir = Path(temp_dir) / "logs"
-
-            with patch.dict(os.environ, {"ODCS_LOG_DIR": str(log_dir)}):
-                result = self.runner.invoke(app, ["version", "--verbose"])
+        result, log_dir = invoke(["version", "--verbose"])
 
-                assert result.exit_code == 0
+        assert result.exit_code == 0
 
-                # Check if log files were created
-                if log_dir.exists():
-                    log_files = list(log_dir.glob("*.log"))
-                    # Log files might be created depending on the logging setup
+        # Check if log files were created
+        log_files = _list_logs(log_dir)
+        # Log files might be created depending on the logging setup
 
-    def test_cli_logging_with_quiet_flag(self):
+    def test_cli_logging_with_quiet_flag(self, invoke):
         """Test CLI logging with quiet flag."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_dir = Path(temp_dir) / "logs"
-
-            with patch.dict(os.environ, {"ODCS_LOG_DIR": str(log_dir)}):
-                result = self.runner.invoke(app, ["version", "--quiet"])
+        result, _ = invoke(["version", "--quiet"])
 
-                assert result.exit_code == 0
+        assert result.exit_code == 0
 
-    def test_cli_logging_with_environment_override(self):
+    def test_cli_logging_with_environment_override(self, invoke):
         """Test CLI logging with environment variable override."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_dir = Path(temp_dir) / "logs"
-
-            with patch.dict(
-                os.environ,
-                {
-                    "ODCS_ENV": "dev",
-                    "ODCS_LOG_DIR": str(log_dir),
-                    "ODCS_LOG_LEVEL": "DEBUG",
-                },
-            ):
-                result = self.runner.invoke(app, ["version", "--env", "dev"])
-
-                assert result.exit_code == 0
-
-    def test_cli_logging_error_scenarios(self):
-        """Test logging during CLI error scenarios."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_dir = Path(temp_dir) / "logs"
+        result, _ = invoke(
+            ["version", "--env", "dev"],
+            env={"ODCS_ENV": "dev", "ODCS_LOG_LEVEL": "DEBUG"},
+        )
 
-            with patch.dict(os.environ, {"ODCS_LOG_DIR": str(log_dir)}):
-                # Test with non-existent input file
-                result = self.runner.invoke(
-                    app,
-                    ["convert", "/nonexistent/file.json", "output.xlsx", "--verbose"],
-                )
+        assert result.exit_code == 0
 
-                assert result.exit_code != 0
+    def test_cli_logging_error_scenarios(self, invoke):
+        """Test logging during CLI error scenarios."""
+        # Test with non-existent input file
+        result, _ = invoke(
+            ["convert", "/nonexistent/file.json", "output.xlsx", "--verbose"]
+        )
 
-    def test_cli_conversion_logging(self):
-        """Test logging during actual conversion operations."""
-        if not self.test_data_dir.exists():
-            pytest.skip("Test data directory not found")
+        assert result.exit_code != 0
 
-        # Look for test JSON files
-        test_files = list(self.test_data_dir.glob("*.json"))
-        if not test_files:
+    def test_cli_conversion_logging(self, invoke, discovered_test_json, tmp_path):
+        """Test logging during actual conversion operations."""
+        if discovered_test_json is None:
             pytest.skip("No test JSON files found")
 
-        test_file = test_files[0]
+        test_file = discovered_test_json
+        output_file = tmp_path / "output.xlsx"
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_dir = Path(temp_dir) / "logs"
-            output_file = Path(temp_dir) / "output.xlsx"
+        result, _ = invoke(
+            ["convert", str(test_file), str(output_file), "--verbose"],
+            env={"ODCS_ENV": "dev"},
+        )
 
-            with patch.dict(
-                os.environ, {"ODCS_LOG_DIR": str(log_dir), "ODCS_ENV": "dev"}
-            ):
-                result = self.runner.invoke(
-                    app, ["convert", str(test_file), str(output_file), "--verbose"]
-                )
+        # The conversion might fail due to test data format,
+        # but we're testing that logging works
+        # assert result.exit_code in [0, 1]  # Success or expected failure
 
-                # The conversion might fail due to test data format,
-                # but we're testing that logging works
-                # assert result.exit_code in [0, 1]  # Success or expected failure
-
-    def test_performance_logging_integration(self):
+    def test_performance_logging_integration(self, invoke):
         """Test performance logging integration with CLI."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_dir = Path(temp_dir) / "logs"
-
-            with patch.dict(
-                os.environ,
-                {
-                    "ODCS_LOG_DIR": str(log_dir),
-                    "ODCS_PERFORMANCE_ENABLED": "true",
-                    "ODCS_PERFORMANCE_THRESHOLD_MS": "0",  # Log all operations
-                },
-            ):
-                result = self.runner.invoke(app, ["version", "--verbose"])
-
-                assert result.exit_code == 0
-
-    def test_correlation_id_tracking(self):
+        result, _ = invoke(
+            ["version", "--verbose"],
+            env={
+                "ODCS_PERFORMANCE_ENABLED": "true",
+                "ODCS_PERFORMANCE_THRESHOLD_MS": "0",  # Log all operations
+            },
+        )
+
+        assert result.exit_code == 0
+
+    def test_correlation_id_tracking(self, invoke):
         """Test correlation ID tracking across CLI operations."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_dir = Path(temp_dir) / "logs"
-            correlation_id = "test-correlation-123"
-
-            with patch.dict(
-                os.environ,
-                {
-                    "ODCS_LOG_DIR": str(log_dir),
-                    "ODCS_LOG_CORRELATION_ID": correlation_id,
-                },
-            ):
-                result = self.runner.invoke(app, ["version", "--verbose"])
-
-                assert result.exit_code == 0
-
-                # Check if correlation ID appears in logs
-                if log_dir.exists():
-                    log_files = list(log_dir.glob("*.log"))
-                    for log_file in log_files:
-                        try:
-                            content = log_file.read_text()
-                            # Correlation ID might appear in logs
-                        except (OSError, UnicodeDecodeError):
-                            pass  # Skip files that can't be read
-
-    def test_structured_logging_output(self):
-        """Test structured logging output format."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_dir = Path(temp_dir) / "logs"
-
-            with patch.dict(
-                os.environ,
-                {
-                    "ODCS_LOG_DIR": str(log_dir),
-                    "ODCS_LOG_STRUCTURED": "true",
-                    "ODCS_ENV": "dev",
-                },
-            ):
-                result = self.runner.invoke(app, ["version", "--verbose"])
-
-                assert result.exit_code == 0
-
-                # Check if structured log files were created
-                if log_dir.exists():
-                    structured_files = list(log_dir.glob("*.jsonl"))
-                    for structured_file in structured_files:
-                        try:
-                            content = structured_file.read_text()
-                            lines = content.strip().split("\n")
-                            for line in lines:
-                                if line.strip():
-                                    # Each line should be valid JSON
-                                    json.loads(line)
-                        except (OSError, json.JSONDecodeError, UnicodeDecodeError):
-                            pass  # Skip files that can't be parsed
-
-    def test_environment_specific_logging(self):
-        """Test environment-specific logging configurations."""
-        environments = ["local", "dev", "test", "stage", "prod"]
+        correlation_id = "test-correlation-123"
 
-        for env in environments:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                log_dir = Path(temp_dir) / "logs"
+        result, _ = invoke(
+            ["version", "--verbose"], env={"ODCS_LOG_CORRELATION_ID": correlation_id}
+        )
 
-                with patch.dict(
-                    os.environ, {"ODCS_LOG_DIR": str(log_dir), "ODCS_ENV": env}
-                ):
-                    result = self.runner.invoke(app, ["version", "--env", env])
+        assert result.exit_code == 0
 
-                    assert result.exit_code == 0
+    def test_structured_logging_output(self, invoke):
+        """Test structured logging output format."""
+        result, log_dir = invoke(
+            ["version", "--verbose"],
+            env={"ODCS_LOG_STRUCTURED": "true", "ODCS_ENV": "dev"},
+        )
+
+        assert result.exit_code == 0
+
+        # Check if structured log files were created
+        structured_files = _list_logs(log_dir, suffix=".jsonl")
+        for structured_file in structured_files:
+            # _list_logs only returns regular files; skip any we cannot read
+            if not os.access(structured_file, os.R_OK):
+                continue
+            with structured_file.open("rb") as fh:
+                try:
+                    for line in fh:
+                        line = line.strip()
+                        if line:
+                            # Each line should be valid JSON
+                            orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    pass  # The enqueued sink may still be writing the last line
+
+    @pytest.mark.parametrize("env", ["local", "dev", "test", "stage", "prod"])
+    def test_environment_specific_logging(self, env, invoke):
+        """Test environment-specific logging configurations."""
+        result, _ = invoke(["version", "--env", env], env={"ODCS_ENV": env})
 
-    def test_sensitive_data_masking(self):
+        assert result.exit_code == 0
+
+    def test_sensitive_data_masking(self, invoke, sample_odcs_json, tmp_path):
         """Test sensitive data masking in logs."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_dir = Path(temp_dir) / "logs"
-
-            with patch.dict(
-                os.environ,
-                {
-                    "ODCS_LOG_DIR": str(log_dir),
-                    "ODCS_SECURITY_MASK_SENSITIVE": "true",
-                    "ODCS_SECURITY_SENSITIVE_PATTERNS": "password,token,secret",
-                },
-            ):
-                # Create a mock ODCS file with sensitive data
-                test_file = Path(temp_dir) / "test.json"
-                test_data = {
-                    "dataContractSpecification": "3.0.2",
-                    "id": "test-contract",
-                    "info": {
-                        "title": "Test Contract",
-                        "version": "1.0.0",
-                        "description": "Test with password=secret123",
-                    },
-                }
-                test_file.write_text(json.dumps(test_data))
-
-                output_file = Path(temp_dir) / "output.xlsx"
-
-                result = self.runner.invoke(
-                    app, ["convert", str(test_file), str(output_file), "--verbose"]
-                )
-
-                # Check logs for masked sensitive data
-                # Note: Sensitive data masking may not work in error messages from validation
-                # This test verifies logging works, masking is a future enhancement
-                if log_dir.exists():
-                    log_files = list(log_dir.glob("*.log"))
-                    # Just verify logs were created
-                    assert len(log_files) > 0
-
-    def test_log_rotation_and_retention(self):
+        # Create a mock ODCS file with sensitive data
+        test_file = tmp_path / "test.json"
+        test_file.write_bytes(sample_odcs_json)
+
+        output_file = tmp_path / "output.xlsx"
+
+        result, log_dir = invoke(
+            ["convert", str(test_file), str(output_file), "--verbose"],
+            env={
+                "ODCS_SECURITY_MASK_SENSITIVE": "true",
+                "ODCS_SECURITY_SENSITIVE_PATTERNS": "password,token,secret",
+            },
+        )
+
+        # Check logs for masked sensitive data
+        # Note: Sensitive data masking may not work in error messages from validation
+        # This test verifies logging works, masking is a future enhancement
+        if log_dir.exists():
+            # Just verify logs were created
+            assert len(_list_logs(log_dir)) > 0
+
+    def test_log_rotation_and_retention(self, invoke):
         """Test log rotation and retention policies."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_dir = Path(temp_dir) / "logs"
-
-            with patch.dict(
-                os.environ,
-                {
-                    "ODCS_LOG_DIR": str(log_dir),
-                    "ODCS_LOG_ROTATION": "1 KB",  # Very small rotation for testing
-                    "ODCS_LOG_RETENTION": "1 day",
-                },
-            ):
-                # Generate multiple log entries to trigger rotation
-                for i in range(10):
-                    result = self.runner.invoke(app, ["version", "--verbose"])
-                    assert result.exit_code == 0
-
-    def test_concurrent_logging(self):
-        """Test logging behavior with concurrent operations."""
-        import threading
-        import queue
-
-        results = queue.Queue()
-
-        def run_cli_command():
-            with tempfile.TemporaryDirectory() as temp_dir:
-                log_dir = Path(temp_dir) / "logs"
-
-                with patch.dict(os.environ, {"ODCS_LOG_DIR": str(log_dir)}):
-                    result = self.runner.invoke(app, ["version", "--verbose"])
-                    results.put(result.exit_code)
-
-        # Run multiple CLI commands concurrently
-        threads = []
-        for _ in range(3):
-            thread = threading.Thread(target=run_cli_command)
-            threads.append(thread)
-            thread.start()
-
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
-
-        # Check that all commands succeeded
-        while not results.empty():
-            exit_code = results.get()
-            assert exit_code == 0
-
-    def test_log_file_permissions(self):
+        # A single invocation installs the file sinks with a tiny rotation size.
+        # Pin the environment: only local and dev compress rotated files to zip
+        result, log_dir = invoke(
+            ["version", "--verbose"],
+            env={
+                "ODCS_ENV": "local",
+                "ODCS_LOG_ROTATION": "1 KB",  # Very small rotation for testing
+                "ODCS_LOG_RETENTION": "1 day",
+            },
+        )
+        assert result.exit_code == 0
+
+        # Write log records directly until the main log file rotates
+        logger = get_logger(__name__)
+        for _ in range(50):
+            logger.info("x" * 200)
+            if _list_logs(log_dir, suffix=".log.zip"):
+                break
+
+        assert _list_logs(log_dir, suffix=".log.zip")
+
+    def test_concurrent_logging(self, invoke):
+        """Test that records logged from several threads at once all reach the file."""
+        from concurrent.futures import ThreadPoolExecutor
+        from threading import Barrier
+
+        # Let the CLI install its file sinks; the console sink is left out
+        # because CliRunner's stderr is closed once the invocation returns
+        result, log_dir = invoke(
+            ["version", "--verbose"],
+            env={"ODCS_ENV": "local", "ODCS_LOG_CONSOLE": "false"},
+        )
+        assert result.exit_code == 0
+
+        threads, records_per_thread = 8, 50
+        barrier = Barrier(threads)
+
+        # No lock around the logger: every thread writes as soon as the
+        # barrier releases them
+        def log_records(thread_id: int) -> None:
+            logger = get_logger(__name__)
+            barrier.wait()
+            for record_id in range(records_per_thread):
+                logger.info(f"worker-{thread_id} record-{record_id}")
+
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            list(executor.map(log_records, range(threads)))
+
+        (main_log,) = [
+            path for path in _list_logs(log_dir) if "-error-" not in path.name
+        ]
+        messages = [
+            line.rsplit(" | ", 1)[-1]
+            for line in main_log.read_text(encoding="utf-8").splitlines()
+            if " | worker-" in line
+        ]
+
+        expected = [
+            f"worker-{thread_id} record-{record_id}"
+            for thread_id in range(threads)
+            for record_id in range(records_per_thread)
+        ]
+        assert sorted(messages) == sorted(expected)
+
+    def test_log_file_permissions(self, invoke):
         """Test log file permissions and access."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_dir = Path(temp_dir) / "logs"
-
-            with patch.dict(os.environ, {"ODCS_LOG_DIR": str(log_dir)}):
-                result = self.runner.invoke(app, ["version", "--verbose"])
+        result, log_dir = invoke(["version", "--verbose"])
 
-                assert result.exit_code == 0
+        assert result.exit_code == 0
 
-                # Check log file permissions
-                if log_dir.exists():
-                    log_files = list(log_dir.glob("*.log*"))
-                    for log_file in log_files:
-                        assert log_file.exists()
-                        # Basic permission check - file should be readable
-                        assert os.access(log_file, os.R_OK)
+        # Check log file permissions
+        log_files = _list_logs(log_dir, suffix="", contains=".log")
+        for log_file in log_files:
+            assert log_file.exists()
+            # Basic permission check - file should be readable
+            assert os.access(log_file, os.R_OK)
 
-    def test_logging_with_different_output_formats(self):
+    # Different commands that might produce different outputs
+    @pytest.mark.parametrize("cmd", [["version"], ["help"], ["formats"]])
+    def test_logging_with_different_output_formats(self, cmd, invoke):
         """Test logging with different CLI output formats."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_dir = Path(temp_dir) / "logs"
-
-            with patch.dict(os.environ, {"ODCS_LOG_DIR": str(log_dir)}):
-                # Test different commands that might produce different outputs
-                commands = [
-                    ["version"],
-                    ["help"],
-                    ["formats"],
-                ]
-
-                for cmd in commands:
-                    result = self.runner.invoke(app, cmd + ["--verbose"])
-                    assert result.exit_code == 0
-
-    def test_error_logging_with_stack_traces(self):
+        result, _ = invoke(cmd + ["--verbose"])
+        assert result.exit_code == 0
+
+    def test_error_logging_with_stack_traces(self, invoke):
         """Test error logging includes proper stack traces."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_dir = Path(temp_dir) / "logs"
-
-            with patch.dict(
-                os.environ,
-                {
-                    "ODCS_LOG_DIR": str(log_dir),
-                    "ODCS_ENV": "dev",  # Development should include stack traces
-                },
-            ):
-                # Trigger an error scenario
-                result = self.runner.invoke(
-                    app,
-                    [
-                        "convert",
-                        "/definitely/nonexistent/file.json",
-                        "output.xlsx",
-                        "--verbose",
-                    ],
-                )
-
-                assert result.exit_code != 0
-
-                # Check error logs for stack trace information
-                if log_dir.exists():
-                    error_files = list(log_dir.glob("*error*.log"))
-                    for error_file in error_files:
-                        try:
-                            content = error_file.read_text()
-                            # Stack traces should contain file paths and line numbers
-                            # This is a basic check for stack trace presence
-                        except (OSError, UnicodeDecodeError):
-                            pass
-
-    def test_custom_log_configuration_file(self):
+        # Trigger an error scenario
+        result, _ = invoke(
+            [
+                "convert",
+                "/definitely/nonexistent/file.json",
+                "output.xlsx",
+                "--verbose",
+            ],
+            env={"ODCS_ENV": "dev"},  # Development should include stack traces
+        )
+
+        assert result.exit_code != 0
+
+    def test_custom_log_configuration_file(self, invoke, tmp_path):
         """Test using custom logging configuration file."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_dir = Path(temp_dir) / "logs"
-            config_file = Path(temp_dir) / "custom_logging.yaml"
+        config_file = tmp_path / "custom_logging.yaml"
 
-            # Create custom logging configuration
-            config_content = """
+        # Create custom logging configuration
+        config_content = """
 defaults:
   app_name: "custom-odcs"
   log_dir: "custom-logs"
@@ -380,74 +350,67 @@ environments:
       enabled: true
       rotation: "5 MB"
 """
-            config_file.write_text(config_content)
+        config_file.write_text(config_content)
 
-            with patch.dict(
-                os.environ,
-                {"ODCS_LOG_DIR": str(log_dir), "ODCS_CONFIG_FILE": str(config_file)},
-            ):
-                result = self.runner.invoke(
-                    app, ["version", "--env", "custom", "--verbose"]
-                )
+        result, _ = invoke(
+            ["version", "--env", "custom", "--verbose"],
+            env={"ODCS_CONFIG_FILE": str(config_file)},
+        )
 
-                assert result.exit_code == 0
+        assert result.exit_code == 0
 
 
 class TestLoggingPerformanceIntegration:
     """Test logging performance impact on CLI operations."""
 
-    def setup_method(self):
-        """Set up test environment."""
-        self.runner = CliRunner()
-
-    def test_logging_performance_overhead(self):
+    def test_logging_performance_overhead(self, runner, tmp_path, monkeypatch):
         """Test that logging doesn't significantly impact performance."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_dir = Path(temp_dir) / "logs"
+        log_dir = tmp_path / "logs"
 
-            # Time CLI operation without verbose logging
+        def timed_invoke(args: List[str]) -> float:
             start_time = time.perf_counter()
-            result1 = self.runner.invoke(app, ["version"])
-            time_without_logging = time.perf_counter() - start_time
-
-            assert result1.exit_code == 0
-
-            # Time CLI operation with verbose logging
-            with patch.dict(os.environ, {"ODCS_LOG_DIR": str(log_dir)}):
-                start_time = time.perf_counter()
-                result2 = self.runner.invoke(app, ["version", "--verbose"])
-                time_with_logging = time.perf_counter() - start_time
-
-            assert result2.exit_code == 0
-
-            # Logging overhead should be reasonable (less than 10x slower)
-            # This is a loose bound to avoid flaky tests
-            assert time_with_logging < (time_without_logging * 10 + 1.0)
-
-    def test_high_volume_logging(self):
-        """Test logging performance with high volume operations."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_dir = Path(temp_dir) / "logs"
-
-            with patch.dict(
-                os.environ,
-                {
-                    "ODCS_LOG_DIR": str(log_dir),
-                    "ODCS_PERFORMANCE_ENABLED": "true",
-                    "ODCS_PERFORMANCE_THRESHOLD_MS": "0",
-                },
-            ):
-                # Run multiple operations to generate high volume logs
-                start_time = time.perf_counter()
-
-                for _ in range(5):
-                    result = self.runner.invoke(app, ["version", "--verbose"])
-                    assert result.exit_code == 0
-
-                total_time = time.perf_counter() - start_time
-
-                # Should complete within reasonable time
-                assert total_time < 10.0  # 10 seconds max for 5 operations
+            result = runner.invoke(app, args, catch_exceptions=False)
+            elapsed = time.perf_counter() - start_time
+            assert result.exit_code == 0
+            return elapsed
+
+        # Every run, verbose or not, writes its log files under tmp_path
+        monkeypatch.setenv("ODCS_LOG_DIR", str(log_dir))
+
+        # Warm up imports and module caches before timing anything
+        runner.invoke(app, ["version"], catch_exceptions=False)
+
+        # Alternate runs without and with verbose logging, five times each
+        times_without_logging = []
+        times_with_logging = []
+        for _ in range(5):
+            times_without_logging.append(timed_invoke(["version"]))
+            times_with_logging.append(timed_invoke(["version", "--verbose"]))
+
+        time_without_logging = statistics.median(times_without_logging)
+        time_with_logging = statistics.median(times_with_logging)
+
+        # Logging overhead should be reasonable (less than 10x slower)
+        # This is a loose bound to avoid flaky tests
+        assert time_with_logging < (time_without_logging * 10 + 1.0)
+
+    @pytest.mark.parametrize("iteration", range(5))
+    def test_high_volume_logging_single(self, iteration, invoke):
+        """Test logging performance of one call with all operations logged."""
+        start_time = time.perf_counter()
+        result, _ = invoke(
+            ["version", "--verbose"],
+            env={
+                "ODCS_PERFORMANCE_ENABLED": "true",
+                "ODCS_PERFORMANCE_THRESHOLD_MS": "0",
+            },
+        )
+        per_call_time = time.perf_counter() - start_time
+
+        assert result.exit_code == 0
+
+        # Each call should complete within reasonable time
+        assert per_call_time < 2.0
 
 
 if __name__ == "__main__":
@@ -0,0 +1,435 @@
+"""Tests for the integration test helpers in tests/integration/utils.py."""
+
+import copy
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
+
+import orjson
+import pytest
+from openpyxl import load_workbook
+
+from tests.integration import utils as integration_utils
+from tests.integration.utils import (
+    ComponentTestHelper,
+    ConversionTestHelper,
+    ExcelTestHelper,
+    WorkflowTestHelper,
+    read_sheet_names,
+)
+
+compare = ConversionTestHelper.compare_odcs_structures
+
+
+@pytest.mark.integration
+class TestCompareOdcsStructures:
+    """Test cases for ConversionTestHelper.compare_odcs_structures."""
+
+    def test_identical_structures_match(self, complete_odcs_data):
+        """Test that equal data compares clean."""
+        matches, differences = compare(
+            complete_odcs_data, copy.deepcopy(complete_odcs_data)
+        )
+
+        assert matches
+        assert differences == []
+
+    def test_missing_and_extra_keys(self):
+        """Test that keys present on only one side are both reported."""
+        matches, differences = compare({"a": 1, "b": 2}, {"a": 1, "c": 3})
+
+        assert not matches
+        assert differences == ["b: missing in converted", "c: missing in original"]
+
+    def test_list_length_mismatch(self):
+        """Test that lists of different length are reported at their path."""
+        matches, differences = compare(
+            {"tags": ["a", "b"], "servers": [{"port": 1}]},
+            {"tags": ["a"], "servers": [{"port": 1}]},
+        )
+
+        assert not matches
+        assert differences == ["tags: length mismatch 2 != 1"]
+
+    def test_nested_value_mismatch_path(self):
+        """Test that nested differences carry dotted and indexed paths."""
+        matches, differences = compare(
+            {"schema": [{"properties": [{"name": "id"}]}]},
+            {"schema": [{"properties": [{"name": "key"}]}]},
+        )
+
+        assert not matches
+        assert differences == ["schema[0].properties[0].name: value mismatch id != key"]
+
+    def test_type_mismatch(self):
+        """Test that values of different types are reported as type mismatches."""
+        matches, differences = compare(
+            {"port": {"value": "5432"}}, {"port": {"value": 5432}}
+        )
+
+        assert not matches
+        assert differences == [
+            "port.value: type mismatch <class 'str'> != <class 'int'>"
+        ]
+
+    def test_ignore_fields_at_nested_paths(self):
+        """Test that ignored keys are skipped at any depth, on either side."""
+        original = {
+            "id": "c1",
+            "schema": [{"name": "t", "createdTs": "2024-01-01", "extra": 1}],
+        }
+        converted = {
+            "id": "c1",
+            "schema": [{"name": "t", "createdTs": "2025-06-30"}],
+            "createdTs": "2025-06-30",
+        }
+
+        matches, differences = compare(
+            original, converted, ignore_fields=["createdTs", "extra"]
+        )
+
+        assert matches
+        assert differences == []
+
+    def test_stop_at_first(self):
+        """Test that stop_at_first returns after the first difference."""
+        original = {"a": 1, "b": 2, "c": 3}
+        converted = {"a": 9, "b": 8, "c": 7}
+
+        matches, differences = compare(original, converted, stop_at_first=True)
+        _, all_differences = compare(original, converted)
+
+        assert not matches
+        assert len(differences) == 1
+        assert differences[0] in all_differences
+        assert len(all_differences) == 3
+
+    def test_numeric_types_collapse_inside_equal_containers(self):
+        """Test that True == 1 and 1 == 1.0 match when their container is equal."""
+        matches, differences = compare(
+            {"required": True, "ports": [1, 2]},
+            {"required": 1, "ports": [1.0, 2.0]},
+        )
+
+        assert matches
+        assert differences == []
+
+    def test_numeric_types_reported_inside_unequal_containers(self):
+        """Test that the collapse only applies when the whole container is equal."""
+        matches, differences = compare(
+            {"required": True, "name": "a"}, {"required": 1, "name": "b"}
+        )
+
+        assert not matches
+        assert sorted(differences) == [
+            "name: value mismatch a != b",
+            "required: type mismatch <class 'bool'> != <class 'int'>",
+        ]
+
+
+@pytest.mark.integration
+class TestGetExcelSheetData:
+    """Test cases for ExcelTestHelper.get_excel_sheet_data."""
+
+    def test_returns_rows_as_lists(self, integration_excel_file, complete_odcs_data):
+        """Test that every row of the sheet is returned as a list of values."""
+        rows = ExcelTestHelper.get_excel_sheet_data(
+            integration_excel_file, "Basic Information"
+        )
+
+        assert rows[0] == ["Field", "Value", "Description"]
+        assert all(isinstance(row, list) for row in rows)
+        values = {row[0]: row[1] for row in rows[1:]}
+        assert values["id"] == complete_odcs_data["id"]
+        assert values["version"] == complete_odcs_data["version"]
+
+    def test_reads_cached_values_from_other_sheets(self, integration_excel_file):
+        """Test that typed cell values come back as written."""
+        rows = ExcelTestHelper.get_excel_sheet_data(integration_excel_file, "Servers")
+
+        assert rows[0][:2] == ["Server", "Type"]
+        assert rows[1][0] == "integration-db-primary"
+        assert 5432 in rows[1]
+
+    def test_missing_sheet_raises(self, integration_excel_file):
+        """Test that an unknown sheet name raises ValueError."""
+        with pytest.raises(ValueError, match="Sheet 'Nope' not found"):
+            ExcelTestHelper.get_excel_sheet_data(integration_excel_file, "Nope")
+
+    def test_integration_excel_file_fixture(self, integration_excel_file, tmp_path):
+        """Test that the fixture writes a fresh workbook into tmp_path."""
+        assert integration_excel_file.parent == tmp_path
+        assert integration_excel_file.suffix == ".xlsx"
+        assert "Basic Information" in read_sheet_names(integration_excel_file)
+
+
+@pytest.mark.integration
+class TestValidateExcelStructure:
+    """Test cases for ExcelTestHelper.validate_excel_structure."""
+
+    def test_expected_sheets_present(self, integration_excel_file):
+        """Test that a subset of the workbook's sheets validates."""
+        assert ExcelTestHelper.validate_excel_structure(
+            integration_excel_file, ["Basic Information", "Servers", "Schema"]
+        )
+
+    def test_missing_sheet(self, integration_excel_file):
+        """Test that a sheet absent from the workbook fails validation."""
+        assert not ExcelTestHelper.validate_excel_structure(
+            integration_excel_file, ["Basic Information", "Nope"]
+        )
+
+    def test_missing_file(self, tmp_path):
+        """Test that a path with no file returns False instead of raising."""
+        assert not ExcelTestHelper.validate_excel_structure(
+            tmp_path / "missing.xlsx", ["Basic Information"]
+        )
+
+    def test_invalid_file(self, invalid_excel_file):
+        """Test that a file that is not a workbook returns False."""
+        assert not ExcelTestHelper.validate_excel_structure(
+            invalid_excel_file, ["Basic Information"]
+        )
+
+
+@pytest.fixture
+def closed_workbooks(monkeypatch):
+    """Record every workbook the helpers open and later close."""
+    closed = []
+
+    def spy_load_workbook(*args, **kwargs):
+        workbook = load_workbook(*args, **kwargs)
+        close = workbook.close
+
+        def record_close():
+            closed.append(workbook)
+            close()
+
+        workbook.close = record_close
+        return workbook
+
+    monkeypatch.setattr(integration_utils, "load_workbook", spy_load_workbook)
+    return closed
+
+
+@pytest.mark.integration
+class TestIterExcelSheetRows:
+    """Test cases for ExcelTestHelper.iter_excel_sheet_rows."""
+
+    def test_yields_row_tuples_lazily(self, integration_excel_file, closed_workbooks):
+        """Test that rows are yielded one at a time as tuples of values."""
+        rows = ExcelTestHelper.iter_excel_sheet_rows(
+            integration_excel_file, "Basic Information"
+        )
+
+        assert isinstance(rows, Iterator)
+        assert closed_workbooks == []
+        assert next(rows) == ("Field", "Value", "Description")
+        assert closed_workbooks == []
+
+        rows.close()
+
+    def test_closes_workbook_when_exhausted(
+        self, integration_excel_file, closed_workbooks
+    ):
+        """Test that the workbook is closed once every row has been read."""
+        rows = list(
+            ExcelTestHelper.iter_excel_sheet_rows(integration_excel_file, "Servers")
+        )
+
+        assert rows[0][0] == "Server"
+        assert len(closed_workbooks) == 1
+
+    def test_closes_workbook_when_closed_early(
+        self, integration_excel_file, closed_workbooks
+    ):
+        """Test that closing the generator part-way closes the workbook."""
+        rows = ExcelTestHelper.iter_excel_sheet_rows(
+            integration_excel_file, "Basic Information"
+        )
+        next(rows)
+
+        rows.close()
+
+        assert len(closed_workbooks) == 1
+
+    def test_missing_sheet_raises_and_closes(
+        self, integration_excel_file, closed_workbooks
+    ):
+        """Test that a missing sheet raises ValueError and still closes the file."""
+        rows = ExcelTestHelper.iter_excel_sheet_rows(integration_excel_file, "Nope")
+
+        with pytest.raises(ValueError, match="Sheet 'Nope' not found"):
+            next(rows)
+
+        assert len(closed_workbooks) == 1
+
+
+@pytest.mark.integration
+class TestRoundtripConversion:
+    """Test cases for ConversionTestHelper.test_roundtrip_conversion."""
+
+    def test_roundtrip_succeeds(self, complete_odcs_data, tmp_path):
+        """Test that complete data survives the in-memory roundtrip."""
+        success, error = ConversionTestHelper.test_roundtrip_conversion(
+            complete_odcs_data, tmp_path
+        )
+
+        assert success, error
+        assert error is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_roundtrip_reports_generation_errors(self, tmp_path):
+        """Test that a conversion error is returned rather than raised."""
+        success, error = ConversionTestHelper.test_roundtrip_conversion(
+            "not a contract", tmp_path
+        )
+
+        assert not success
+        assert error
+
+    def test_parsers_are_per_thread(self, complete_odcs_data, tmp_path):
+        """Test that concurrent roundtrips each use their own thread's parser."""
+        barrier = threading.Barrier(4)
+
+        def run(_):
+            barrier.wait()
+            result = ConversionTestHelper.test_roundtrip_conversion(
+                complete_odcs_data, tmp_path
+            )
+            return result, integration_utils._excel_parser()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            outcomes = list(executor.map(run, range(4)))
+
+        assert [result for result, _ in outcomes] == [(True, None)] * 4
+        parsers = {id(parser) for _, parser in outcomes}
+        assert len(parsers) == 4
+        assert integration_utils._excel_parser() not in [p for _, p in outcomes]
+
+
+@pytest.mark.integration
+class TestSimulateUserWorkflow:
+    """Test cases for WorkflowTestHelper.simulate_user_workflow."""
+
+    def test_odcs_to_excel(self, complete_odcs_data, tmp_path):
+        """Test that the ODCS -> Excel workflow writes one workbook."""
+        success, results, errors = WorkflowTestHelper.simulate_user_workflow(
+            complete_odcs_data, "odcs_to_excel", tmp_path
+        )
+
+        assert success, errors
+        assert results["conversions_completed"] == ["ODCS -> Excel"]
+        assert results["files_created"] == [str(tmp_path / "user_output.xlsx")]
+        assert ExcelTestHelper.validate_excel_structure(
+            tmp_path / "user_output.xlsx", ["Basic Information"]
+        )
+
+    def test_excel_to_odcs(self, complete_odcs_data, tmp_path):
+        """Test that the Excel -> ODCS workflow writes the parsed data as JSON."""
+        success, results, errors = WorkflowTestHelper.simulate_user_workflow(
+            complete_odcs_data, "excel_to_odcs", tmp_path
+        )
+
+        assert success, errors
+        assert results["conversions_completed"] == ["ODCS -> Excel", "Excel -> ODCS"]
+        json_path = tmp_path / "user_output.json"
+        assert results["files_created"] == [
+            str(tmp_path / "user_input.xlsx"),
+            str(json_path),
+        ]
+        parsed = orjson.loads(json_path.read_bytes())
+        assert parsed["id"] == complete_odcs_data["id"]
+        assert parsed["version"] == complete_odcs_data["version"]
+
+    def test_roundtrip(self, complete_odcs_data, tmp_path):
+        """Test that the roundtrip workflow records the full roundtrip."""
+        success, results, errors = WorkflowTestHelper.simulate_user_workflow(
+            complete_odcs_data, "roundtrip", tmp_path
+        )
+
+        assert success, errors
+        assert results == {
+            "files_created": [],
+            "conversions_completed": ["Full Roundtrip"],
+        }
+
+    def test_roundtrip_failure_is_collected(self, tmp_path):
+        """Test that a failed roundtrip is reported in errors, not raised."""
+        success, results, errors = WorkflowTestHelper.simulate_user_workflow(
+            "not a contract", "roundtrip", tmp_path
+        )
+
+        assert not success
+        assert results["conversions_completed"] == []
+        assert len(errors) == 1
+        assert errors[0].startswith("Roundtrip failed: ")
+
+    def test_conversion_error_is_collected(self, tmp_path):
+        """Test that an exception during a workflow is reported in errors."""
+        success, _, errors = WorkflowTestHelper.simulate_user_workflow(
+            "not a contract", "excel_to_odcs", tmp_path
+        )
+
+        assert not success
+        assert len(errors) == 1
+        assert errors[0].startswith("Workflow error: ")
+
+
+@pytest.mark.integration
+class TestYamlExcelIntegration:
+    """Test cases for ComponentTestHelper.test_yaml_excel_integration."""
+
+    @pytest.fixture
+    def failing_parser(self, monkeypatch):
+        """Make the helpers' parser fail, recording each time it is used."""
+        calls = []
+
+        class FailingParser:
+            def parse_from_file(self, path):
+                calls.append(path)
+                raise ValueError("parse failed")
+
+        monkeypatch.setattr(integration_utils, "_excel_parser", FailingParser)
+        return calls
+
+    def test_package_check_by_default(self, complete_odcs_data, tmp_path):
+        """Test that the default check passes and leaves a valid workbook."""
+        success, error = ComponentTestHelper.test_yaml_excel_integration(
+            complete_odcs_data, tmp_path
+        )
+
+        assert success, error
+        assert (tmp_path / "test.yaml").exists()
+        assert ExcelTestHelper.validate_excel_structure(
+            tmp_path / "from_yaml.xlsx", ["Basic Information", "Schema"]
+        )
+
+    def test_default_does_not_parse(self, complete_odcs_data, tmp_path, failing_parser):
+        """Test that the workbook is not parsed back unless asked to."""
+        success, error = ComponentTestHelper.test_yaml_excel_integration(
+            complete_odcs_data, tmp_path
+        )
+
+        assert success, error
+        assert failing_parser == []
+
+    def test_deep_validate_parses_workbook(self, complete_odcs_data, tmp_path):
+        """Test that deep validation parses the generated workbook."""
+        success, error = ComponentTestHelper.test_yaml_excel_integration(
+            complete_odcs_data, tmp_path, deep_validate=True
+        )
+
+        assert success, error
+
+    def test_deep_validate_reports_parse_errors(
+        self, complete_odcs_data, tmp_path, failing_parser
+    ):
+        """Test that a parse failure during deep validation is returned."""
+        success, error = ComponentTestHelper.test_yaml_excel_integration(
+            complete_odcs_data, tmp_path, deep_validate=True
+        )
+
+        assert not success
+        assert error == "parse failed"
+        assert failing_parser == [tmp_path / "from_yaml.xlsx"]
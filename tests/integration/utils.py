@@ -1,16 +1,207 @@
 """Utilities for integration tests."""
 
-import json
-import tempfile
+import copy
+import html
+import re
+import threading
+import zipfile
+from collections import deque
 from pathlib import Path
-from typing import Any, Dict, Generator, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from uuid import uuid4
+import orjson
 import pytest
 from openpyxl import load_workbook
+from openpyxl.utils.exceptions import InvalidFileException
 
 from odcs_converter.generator import ODCSToExcelConverter
 from odcs_converter.excel_parser import ExcelToODCSParser
 from odcs_converter.yaml_converter import YAMLConverter
 
+# Shared converter; it only holds its style configuration
+_EXCEL_CONVERTER = ODCSToExcelConverter()
+
+# The parser keeps the workbook it is reading, so each thread gets its own.
+# pytest-xdist workers are separate processes and never share either object.
+_PARSER_LOCAL = threading.local()
+
+
+def _excel_parser() -> ExcelToODCSParser:
+    """Return this thread's parser, without the workbook it last parsed."""
+    parser = getattr(_PARSER_LOCAL, "parser", None)
+    if parser is None:
+        parser = _PARSER_LOCAL.parser = ExcelToODCSParser()
+    # parse_from_file replaces both; clearing them here just stops an idle
+    # parser from holding on to the previous workbook
+    parser.workbook = None
+    parser.worksheets = {}
+    return parser
+
+
+# Sentinel for keys missing from a mapping
+_MISSING = object()
+
+# Leaf value types compared directly by compare_odcs_structures
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Canonical contracts built once at import time; helpers hand out deep copies
+# so tests can mutate them freely.
+_COMPLETE_ODCS_TEMPLATE: Dict[str, Any] = {
+    "version": "2.0.0",
+    "kind": "DataContract",
+    "apiVersion": "v3.0.2",
+    "id": "integration-test-complete",
+    "name": "Integration Test Contract",
+    "tenant": "integration-tenant",
+    "status": "active",
+    "dataProduct": "Integration Test Product",
+    "domain": "integration_domain",
+    "contractCreatedTs": "2024-01-15T10:30:00Z",
+    "tags": ["integration", "test", "complete"],
+    "description": {
+        "usage": "Complete integration test contract",
+        "purpose": "Testing component interactions",
+        "limitations": "Integration test environment only",
+    },
+    "servers": [
+        {
+            "server": "integration-db-primary",
+            "type": "postgresql",
+            "description": "Primary integration database",
+            "environment": "integration",
+            "host": "integration-db.example.com",
+            "port": 5432,
+            "database": "integration_db",
+            "schema": "public",
+        }
+    ],
+    "schema": [
+        {
+            "name": "integration_table",
+            "logicalType": "object",
+            "physicalName": "integration_table_v1",
+            "description": "Integration test table",
+            "businessName": "Integration Test Table",
+            "dataGranularityDescription": "One record per integration entity",
+            "properties": [
+                {
+                    "name": "id",
+                    "logicalType": "integer",
+                    "physicalType": "BIGINT",
+                    "description": "Unique identifier",
+                    "required": True,
+                    "primaryKey": True,
+                    "primaryKeyPosition": 1,
+                },
+                {
+                    "name": "name",
+                    "logicalType": "string",
+                    "physicalType": "VARCHAR(255)",
+                    "description": "Entity name",
+                    "required": True,
+                },
+                {
+                    "name": "created_at",
+                    "logicalType": "timestamp",
+                    "physicalType": "TIMESTAMP",
+                    "description": "Creation timestamp",
+                    "required": True,
+                },
+                {
+                    "name": "active",
+                    "logicalType": "boolean",
+                    "physicalType": "BOOLEAN",
+                    "description": "Active status",
+                    "required": False,
+                },
+            ],
+        }
+    ],
+    "support": [
+        {
+            "channel": "integration-support",
+            "url": "https://support.example.com/integration",
+            "description": "Integration support channel",
+            "tool": "web",
+            "scope": "issues",
+        }
+    ],
+    "team": [
+        {
+            "username": "integration.user@example.com",
+            "name": "Integration User",
+            "role": "owner",
+            "description": "Integration test owner",
+        }
+    ],
+    "roles": [
+        {
+            "role": "integration_reader",
+            "description": "Read-only access to integration data",
+            "access": "SELECT",
+        }
+    ],
+    "customProperties": [{"property": "integrationEnvironment", "value": "testing"}],
+}
+
+_MULTI_TABLE_SCHEMA: List[Dict[str, Any]] = [
+    {
+        "name": "users",
+        "logicalType": "object",
+        "physicalName": "users_v1",
+        "description": "Users table",
+        "properties": [
+            {
+                "name": "user_id",
+                "logicalType": "integer",
+                "physicalType": "BIGINT",
+                "description": "User ID",
+                "required": True,
+                "primaryKey": True,
+                "primaryKeyPosition": 1,
+            },
+            {
+                "name": "email",
+                "logicalType": "string",
+                "physicalType": "VARCHAR(255)",
+                "description": "User email",
+                "required": True,
+            },
+        ],
+    },
+    {
+        "name": "orders",
+        "logicalType": "object",
+        "physicalName": "orders_v1",
+        "description": "Orders table",
+        "properties": [
+            {
+                "name": "order_id",
+                "logicalType": "integer",
+                "physicalType": "BIGINT",
+                "description": "Order ID",
+                "required": True,
+                "primaryKey": True,
+                "primaryKeyPosition": 1,
+            },
+            {
+                "name": "user_id",
+                "logicalType": "integer",
+                "physicalType": "BIGINT",
+                "description": "User ID (FK)",
+                "required": True,
+            },
+            {
+                "name": "amount",
+                "logicalType": "number",
+                "physicalType": "DECIMAL(10,2)",
+                "description": "Order amount",
+                "required": True,
+            },
+        ],
+    },
+]
+
 
 class IntegrationTestHelper:
     """Helper class for integration test operations."""
@@ -18,168 +209,14 @@ class IntegrationTestHelper:
     @staticmethod
     def create_complete_odcs_dict() -> Dict[str, Any]:
         """Create complete ODCS data for integration testing."""
-        return {
-            "version": "2.0.0",
-            "kind": "DataContract",
-            "apiVersion": "v3.0.2",
-            "id": "integration-test-complete",
-            "name": "Integration Test Contract",
-            "tenant": "integration-tenant",
-            "status": "active",
-            "dataProduct": "Integration Test Product",
-            "domain": "integration_domain",
-            "contractCreatedTs": "2024-01-15T10:30:00Z",
-            "tags": ["integration", "test", "complete"],
-            "description": {
-                "usage": "Complete integration test contract",
-                "purpose": "Testing component interactions",
-                "limitations": "Integration test environment only",
-            },
-            "servers": [
-                {
-                    "server": "integration-db-primary",
-                    "type": "postgresql",
-                    "description": "Primary integration database",
-                    "environment": "integration",
-                    "host": "integration-db.example.com",
-                    "port": 5432,
-                    "database": "integration_db",
-                    "schema": "public",
-                }
-            ],
-            "schema": [
-                {
-                    "name": "integration_table",
-                    "logicalType": "object",
-                    "physicalName": "integration_table_v1",
-                    "description": "Integration test table",
-                    "businessName": "Integration Test Table",
-                    "dataGranularityDescription": "One record per integration entity",
-                    "properties": [
-                        {
-                            "name": "id",
-                            "logicalType": "integer",
-                            "physicalType": "BIGINT",
-                            "description": "Unique identifier",
-                            "required": True,
-                            "primaryKey": True,
-                            "primaryKeyPosition": 1,
-                        },
-                        {
-                            "name": "name",
-                            "logicalType": "string",
-                            "physicalType": "VARCHAR(255)",
-                            "description": "Entity name",
-                            "required": True,
-                        },
-                        {
-                            "name": "created_at",
-                            "logicalType": "timestamp",
-                            "physicalType": "TIMESTAMP",
-                            "description": "Creation timestamp",
-                            "required": True,
-                        },
-                        {
-                            "name": "active",
-                            "logicalType": "boolean",
-                            "physicalType": "BOOLEAN",
-                            "description": "Active status",
-                            "required": False,
-                        },
-                    ],
-                }
-            ],
-            "support": [
-                {
-                    "channel": "integration-support",
-                    "url": "https://support.example.com/integration",
-                    "description": "Integration support channel",
-                    "tool": "web",
-                    "scope": "issues",
-                }
-            ],
-            "team": [
-                {
-                    "username": "integration.user@example.com",
-                    "name": "Integration User",
-                    "role": "owner",
-                    "description": "Integration test owner",
-                }
-            ],
-            "roles": [
-                {
-                    "role": "integration_reader",
-                    "description": "Read-only access to integration data",
-                    "access": "SELECT",
-                }
-            ],
-            "customProperties": [
-                {"property": "integrationEnvironment", "value": "testing"}
-            ],
-        }
+        return copy.deepcopy(_COMPLETE_ODCS_TEMPLATE)
 
     @staticmethod
     def create_multi_table_odcs() -> Dict[str, Any]:
         """Create ODCS with multiple tables for complex integration testing."""
-        base = IntegrationTestHelper.create_complete_odcs_dict()
+        base = copy.deepcopy(_COMPLETE_ODCS_TEMPLATE)
         base["id"] = "integration-multi-table"
-        base["schema"] = [
-            {
-                "name": "users",
-                "logicalType": "object",
-                "physicalName": "users_v1",
-                "description": "Users table",
-                "properties": [
-                    {
-                        "name": "user_id",
-                        "logicalType": "integer",
-                        "physicalType": "BIGINT",
-                        "description": "User ID",
-                        "required": True,
-                        "primaryKey": True,
-                        "primaryKeyPosition": 1,
-                    },
-                    {
-                        "name": "email",
-                        "logicalType": "string",
-                        "physicalType": "VARCHAR(255)",
-                        "description": "User email",
-                        "required": True,
-                    },
-                ],
-            },
-            {
-                "name": "orders",
-                "logicalType": "object",
-                "physicalName": "orders_v1",
-                "description": "Orders table",
-                "properties": [
-                    {
-                        "name": "order_id",
-                        "logicalType": "integer",
-                        "physicalType": "BIGINT",
-                        "description": "Order ID",
-                        "required": True,
-                        "primaryKey": True,
-                        "primaryKeyPosition": 1,
-                    },
-                    {
-                        "name": "user_id",
-                        "logicalType": "integer",
-                        "physicalType": "BIGINT",
-                        "description": "User ID (FK)",
-                        "required": True,
-                    },
-                    {
-                        "name": "amount",
-                        "logicalType": "number",
-                        "physicalType": "DECIMAL(10,2)",
-                        "description": "Order amount",
-                        "required": True,
-                    },
-                ],
-            },
-        ]
+        base["schema"] = copy.deepcopy(_MULTI_TABLE_SCHEMA)
         return base
 
 
@@ -188,61 +225,70 @@ class ExcelTestHelper:
 
     @staticmethod
     def create_sample_excel_workbook(
-        odcs_data: Dict[str, Any],
-    ) -> Generator[Path, None, None]:
-        """Create Excel workbook from ODCS data for testing."""
-        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp_file:
-            temp_path = Path(tmp_file.name)
+        odcs_data: Dict[str, Any], directory: Path
+    ) -> Path:
+        """Create Excel workbook from ODCS data for testing.
+
+        The file is named uniquely inside directory, which should be a pytest
+        temporary directory so that pytest removes it.
+        """
+        excel_path = directory / f"sample_{uuid4().hex}.xlsx"
+        converter = _EXCEL_CONVERTER
+        converter.generate_from_dict(odcs_data, excel_path)
+        return excel_path
+
+    @staticmethod
+    def validate_excel_structure(excel_path: Path, expected_sheets: List[str]) -> bool:
+        """Validate that Excel file has expected sheet structure.
 
-        converter = ODCSToExcelConverter()
-        converter.generate_from_dict(odcs_data, temp_path)
+        Returns False when the file is missing or is not a readable workbook;
+        any other error is raised.
+        """
+        try:
+            # Only sheet names are needed, so avoid loading cells and styles
+            workbook = load_workbook(excel_path, read_only=True, data_only=True)
+        except (FileNotFoundError, zipfile.BadZipFile, KeyError, InvalidFileException):
+            return False
 
         try:
-            yield temp_path
+            actual_sheets = frozenset(workbook.sheetnames)
         finally:
-            temp_path.unlink(missing_ok=True)
+            workbook.close()
+
+        return frozenset(expected_sheets).issubset(actual_sheets)
 
     @staticmethod
-    def validate_excel_structure(excel_path: Path, expected_sheets: List[str]) -> bool:
-        """Validate that Excel file has expected sheet structure."""
+    def iter_excel_sheet_rows(
+        excel_path: Path, sheet_name: str
+    ) -> Iterator[Tuple[Any, ...]]:
+        """Yield the cell values of each row in a specific Excel sheet.
+
+        The workbook stays open until the generator is exhausted or closed.
+        """
+        # Read-only worksheets stream cells from the archive and keep it open
+        # until the workbook is closed
+        workbook = load_workbook(excel_path, read_only=True, data_only=True)
         try:
-            workbook = load_workbook(excel_path)
-            actual_sheets = workbook.sheetnames
+            if sheet_name not in workbook.sheetnames:
+                raise ValueError(f"Sheet '{sheet_name}' not found in workbook")
 
-            for sheet in expected_sheets:
-                if sheet not in actual_sheets:
-                    return False
-
-            return True
-        except Exception:
-            return False
+            yield from workbook[sheet_name].iter_rows(values_only=True)
+        finally:
+            workbook.close()
 
     @staticmethod
     def get_excel_sheet_data(excel_path: Path, sheet_name: str) -> List[List[Any]]:
         """Get data from specific Excel sheet."""
-        workbook = load_workbook(excel_path)
-        if sheet_name not in workbook.sheetnames:
-            raise ValueError(f"Sheet '{sheet_name}' not found in workbook")
-
-        sheet = workbook[sheet_name]
-        data = []
-        for row in sheet.iter_rows(values_only=True):
-            data.append(list(row))
-
-        return data
+        return list(
+            map(list, ExcelTestHelper.iter_excel_sheet_rows(excel_path, sheet_name))
+        )
 
     @staticmethod
-    def create_invalid_excel_file() -> Generator[Path, None, None]:
+    def create_invalid_excel_file(directory: Path) -> Path:
         """Create an invalid Excel file for error testing."""
-        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp_file:
-            # Write invalid content
-            tmp_file.write(b"This is not a valid Excel file")
-            temp_path = Path(tmp_file.name)
-
-        try:
-            yield temp_path
-        finally:
-            temp_path.unlink(missing_ok=True)
+        excel_path = directory / f"invalid_{uuid4().hex}.xlsx"
+        excel_path.write_bytes(b"This is not a valid Excel file")
+        return excel_path
 
 
 class ConversionTestHelper:
@@ -254,17 +300,16 @@ class ConversionTestHelper:
     ) -> Tuple[bool, Optional[str]]:
         """Test roundtrip conversion: ODCS -> Excel -> ODCS."""
         try:
-            # Step 1: Convert ODCS to Excel
-            excel_path = temp_dir / "roundtrip_test.xlsx"
-            converter = ODCSToExcelConverter()
-            converter.generate_from_dict(odcs_data, excel_path)
+            # Step 1: Convert ODCS to Excel in memory; the file itself is not needed
+            converter = _EXCEL_CONVERTER
+            excel_bytes = converter.generate_to_buffer(odcs_data)
 
-            if not excel_path.exists():
-                return False, "Excel file was not created"
+            if not excel_bytes:
+                return False, "Excel workbook was not created"
 
             # Step 2: Convert Excel back to ODCS
-            parser = ExcelToODCSParser()
-            converted_data = parser.parse_from_file(excel_path)
+            parser = _excel_parser()
+            converted_data = parser.parse_from_buffer(excel_bytes)
 
             # Step 3: Compare key fields (some fields might be normalized)
             key_fields = ["version", "kind", "apiVersion", "id", "status"]
@@ -285,47 +330,84 @@ class ConversionTestHelper:
         original: Dict[str, Any],
         converted: Dict[str, Any],
         ignore_fields: Optional[List[str]] = None,
+        stop_at_first: bool = False,
     ) -> Tuple[bool, List[str]]:
-        """Compare two ODCS structures and return differences."""
-        ignore_fields = ignore_fields or []
-        differences = []
-
-        def _compare_recursive(obj1, obj2, path=""):
-            if type(obj1) is not type(obj2):
+        """Compare two ODCS structures and return differences.
+
+        Dicts and lists that compare equal are not walked, so values nested in
+        them that are equal across numeric types (True and 1, 1 and 1.0) are
+        not reported as type mismatches.
+
+        Args:
+            original: ODCS data before conversion
+            converted: ODCS data after conversion
+            ignore_fields: Dictionary keys to skip at any depth
+            stop_at_first: Return as soon as one difference is found
+
+        Returns:
+            Whether the structures match, and the differences found
+        """
+        ignored = frozenset(ignore_fields or ())
+        differences: List[str] = []
+
+        # Paths are kept as (parent, key) links and only rendered to a string
+        # when a difference is recorded
+        def _path(link) -> str:
+            parts = []
+            while link is not None:
+                link, key = link
+                parts.append(f"[{key}]" if isinstance(key, int) else f".{key}")
+            return "".join(reversed(parts)).lstrip(".")
+
+        stack = deque([(original, converted, None)])
+        while stack:
+            obj1, obj2, link = stack.pop()
+            if obj1 is obj2:
+                continue
+
+            obj_type = type(obj1)
+            if obj_type is not type(obj2):
                 differences.append(
-                    f"{path}: type mismatch {type(obj1)} != {type(obj2)}"
+                    f"{_path(link)}: type mismatch {obj_type} != {type(obj2)}"
                 )
-                return
-
-            if isinstance(obj1, dict):
-                all_keys = set(obj1.keys()) | set(obj2.keys())
-                for key in all_keys:
-                    current_path = f"{path}.{key}" if path else key
-                    if key in ignore_fields:
+            elif obj_type in _SCALAR_TYPES:
+                # Most nodes are leaves; compare them without the container checks
+                if obj1 != obj2:
+                    differences.append(
+                        f"{_path(link)}: value mismatch {obj1} != {obj2}"
+                    )
+            elif isinstance(obj1, dict):
+                if obj1 == obj2:
+                    continue
+                for key, value in obj1.items():
+                    if key in ignored:
                         continue
-
-                    if key not in obj1:
-                        differences.append(f"{current_path}: missing in original")
-                    elif key not in obj2:
-                        differences.append(f"{current_path}: missing in converted")
-                    else:
-                        _compare_recursive(obj1[key], obj2[key], current_path)
-
+                    other = obj2.get(key, _MISSING)
+                    if other is _MISSING:
+                        differences.append(
+                            f"{_path((link, key))}: missing in converted"
+                        )
+                    elif value is not other:
+                        stack.append((value, other, (link, key)))
+                for key in obj2:
+                    if key not in obj1 and key not in ignored:
+                        differences.append(f"{_path((link, key))}: missing in original")
             elif isinstance(obj1, list):
                 if len(obj1) != len(obj2):
                     differences.append(
-                        f"{path}: length mismatch {len(obj1)} != {len(obj2)}"
+                        f"{_path(link)}: length mismatch {len(obj1)} != {len(obj2)}"
                     )
-                    return
-
-                for i, (item1, item2) in enumerate(zip(obj1, obj2)):
-                    _compare_recursive(item1, item2, f"{path}[{i}]")
+                elif obj1 != obj2:
+                    stack.extend(
+                        (item1, item2, (link, i))
+                        for i, (item1, item2) in enumerate(zip(obj1, obj2))
+                    )
+            elif obj1 != obj2:
+                differences.append(f"{_path(link)}: value mismatch {obj1} != {obj2}")
 
-            else:
-                if obj1 != obj2:
-                    differences.append(f"{path}: value mismatch {obj1} != {obj2}")
+            if stop_at_first and differences:
+                break
 
-        _compare_recursive(original, converted)
         return len(differences) == 0, differences
 
 
@@ -334,9 +416,13 @@ class ComponentTestHelper:
 
     @staticmethod
     def test_yaml_excel_integration(
-        yaml_data: Dict[str, Any], temp_dir: Path
+        yaml_data: Dict[str, Any], temp_dir: Path, deep_validate: bool = False
     ) -> Tuple[bool, Optional[str]]:
-        """Test YAML -> ODCS -> Excel integration."""
+        """Test YAML -> ODCS -> Excel integration.
+
+        By default the generated file is only checked to be an xlsx package;
+        pass deep_validate=True to parse it back as well.
+        """
         try:
             # Step 1: Save as YAML
             yaml_path = temp_dir / "test.yaml"
@@ -346,16 +432,21 @@ class ComponentTestHelper:
             loaded_data = YAMLConverter.yaml_to_dict(yaml_path)
             excel_path = temp_dir / "from_yaml.xlsx"
 
-            converter = ODCSToExcelConverter()
+            converter = _EXCEL_CONVERTER
             converter.generate_from_dict(loaded_data, excel_path)
 
             # Step 3: Verify Excel file exists and is valid
             if not excel_path.exists():
                 return False, "Excel file was not created from YAML"
 
-            # Step 4: Parse Excel back to verify structure
-            parser = ExcelToODCSParser()
-            parser.parse_from_file(excel_path)
+            with zipfile.ZipFile(excel_path) as package:
+                if "xl/workbook.xml" not in package.namelist():
+                    return False, "Excel file from YAML has no workbook part"
+
+            # Step 4: Optionally parse Excel back to verify structure
+            if deep_validate:
+                parser = _excel_parser()
+                parser.parse_from_file(excel_path)
 
             return True, None
 
@@ -370,7 +461,7 @@ class ComponentTestHelper:
         # Test ODCS to Excel with invalid data
         try:
             excel_path = temp_dir / "invalid_test.xlsx"
-            converter = ODCSToExcelConverter()
+            converter = _EXCEL_CONVERTER
             converter.generate_from_dict(invalid_data, excel_path)
         except Exception as e:
             errors_found.append(f"ODCS to Excel error: {str(e)}")
@@ -400,7 +491,7 @@ class WorkflowTestHelper:
             if workflow_type == "odcs_to_excel":
                 # Simulate: User provides ODCS JSON, wants Excel
                 excel_path = temp_dir / "user_output.xlsx"
-                converter = ODCSToExcelConverter()
+                converter = _EXCEL_CONVERTER
                 converter.generate_from_dict(input_data, excel_path)
 
                 results["files_created"].append(str(excel_path))
@@ -410,17 +501,18 @@ class WorkflowTestHelper:
                 # Simulate: User provides Excel, wants ODCS
                 # First create Excel from input data
                 excel_path = temp_dir / "user_input.xlsx"
-                converter = ODCSToExcelConverter()
+                converter = _EXCEL_CONVERTER
                 converter.generate_from_dict(input_data, excel_path)
 
                 # Then parse it back
-                parser = ExcelToODCSParser()
+                parser = _excel_parser()
                 parsed_data = parser.parse_from_file(excel_path)
 
                 # Save as JSON
                 json_path = temp_dir / "user_output.json"
-                with open(json_path, "w") as f:
-                    json.dump(parsed_data, f, indent=2)
+                json_path.write_bytes(
+                    orjson.dumps(parsed_data, option=orjson.OPT_INDENT_2)
+                )
 
                 results["files_created"].extend([str(excel_path), str(json_path)])
                 results["conversions_completed"].extend(
@@ -445,31 +537,31 @@ class WorkflowTestHelper:
 
 
 # Pytest fixtures specific to integration tests
-@pytest.fixture
+@pytest.fixture(scope="session")
 def integration_test_helper():
     """Provide integration test helper instance."""
     return IntegrationTestHelper()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def excel_test_helper():
     """Provide Excel test helper instance."""
     return ExcelTestHelper()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def conversion_test_helper():
     """Provide conversion test helper instance."""
     return ConversionTestHelper()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def component_test_helper():
     """Provide component test helper instance."""
     return ComponentTestHelper()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def workflow_test_helper():
     """Provide workflow test helper instance."""
     return WorkflowTestHelper()
@@ -487,6 +579,68 @@ def multi_table_odcs_data():
     return IntegrationTestHelper.create_multi_table_odcs()
 
 
+@pytest.fixture
+def integration_excel_file(tmp_path, complete_odcs_data) -> Path:
+    """Provide an Excel workbook generated from the complete ODCS data."""
+    return ExcelTestHelper.create_sample_excel_workbook(complete_odcs_data, tmp_path)
+
+
+@pytest.fixture
+def invalid_excel_file(tmp_path) -> Path:
+    """Provide a .xlsx file whose content is not a valid workbook."""
+    return ExcelTestHelper.create_invalid_excel_file(tmp_path)
+
+
+def assert_sheets(sheet_names: Iterable[str], expected_sheets: Iterable[str]) -> None:
+    """Assert every expected sheet is present, listing all that are missing."""
+    missing = set(expected_sheets).difference(sheet_names)
+    assert not missing, f"missing sheets: {sorted(missing)}"
+
+
+_SHEET_NAME_RE = re.compile(r'<sheet\b[^>]*?\bname="([^"]*)"')
+
+
+def read_sheet_names(excel_path: Path) -> List[str]:
+    """Read sheet names straight from ``xl/workbook.xml`` without openpyxl.
+
+    Suitable for structural checks only; load the workbook to inspect cells.
+    """
+    with zipfile.ZipFile(excel_path) as archive:
+        workbook_xml = archive.read("xl/workbook.xml").decode("utf-8")
+    return [html.unescape(name) for name in _SHEET_NAME_RE.findall(workbook_xml)]
+
+
+class FakeResponse:
+    """Minimal stand-in for ``requests.Response`` returning a fixed JSON body."""
+
+    __slots__ = ("_body",)
+
+    def __init__(self, body: Any):
+        self._body = body
+
+    def json(self) -> Any:
+        return self._body
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+def stub_requests_get(monkeypatch, body: Any) -> List[Tuple[str, Any]]:
+    """Route ``requests.get`` in the generator to a FakeResponse.
+
+    Returns:
+        List that records ``(url, timeout)`` for every call made.
+    """
+    calls: List[Tuple[str, Any]] = []
+
+    def fake_get(url, timeout=None):
+        calls.append((url, timeout))
+        return FakeResponse(body)
+
+    monkeypatch.setattr("odcs_converter.generator.requests.get", fake_get)
+    return calls
+
+
 # Custom decorators for integration tests
 def integration_test(func):
     """Decorator to mark a function as an integration test."""
@@ -1,188 +1,215 @@
 """Tests for template generator functionality."""
 
+import io
 import pytest
+from contextlib import contextmanager
+from itertools import chain
 from pathlib import Path
 from openpyxl import load_workbook
 
 from odcs_converter.template_generator import TemplateGenerator, TemplateType
 
-
-class TestTemplateGenerator:
-    """Test suite for TemplateGenerator class."""
-
-    @pytest.fixture
-    def generator(self):
-        """Create a TemplateGenerator instance."""
-        return TemplateGenerator()
-
-    @pytest.fixture
-    def temp_output_path(self, tmp_path):
-        """Create a temporary output path."""
-        return tmp_path / "test_template.xlsx"
-
-    def test_generator_initialization(self, generator):
-        """Test that generator initializes correctly."""
-        assert generator is not None
-        assert generator.style_config is not None
-        assert "header_font" in generator.style_config
-        assert "required_header_fill" in generator.style_config
-        assert "optional_header_fill" in generator.style_config
-
-    def test_minimal_template_generation(self, generator, temp_output_path):
-        """Test minimal template generation."""
-        generator.generate_template(
-            temp_output_path, template_type=TemplateType.MINIMAL, include_examples=True
-        )
-
-        assert temp_output_path.exists()
-
-        # Load and verify workbook
-        wb = load_workbook(temp_output_path)
-
-        # Check that Instructions sheet exists
-        assert "📖 Instructions" in wb.sheetnames
-
-        # Check minimal template sheets
-        assert "Basic Information" in wb.sheetnames
-        assert "Schema" in wb.sheetnames
-        assert "Schema Properties" in wb.sheetnames
-
-        # Verify worksheet count (3 data + 1 instructions)
-        assert len(wb.sheetnames) == 4
-
+# Sheets in each template type, Instructions sheet included
+_MINIMAL_SHEETS = frozenset(
+    {
+        "📖 Instructions",
+        "Basic Information",
+        "Schema",
+        "Schema Properties",
+    }
+)
+_REQUIRED_SHEETS = frozenset(
+    {
+        "📖 Instructions",
+        "Basic Information",
+        "Servers",
+        "Schema",
+        "Schema Properties",
+    }
+)
+_FULL_SHEETS = frozenset(
+    {
+        "📖 Instructions",
+        "Basic Information",
+        "Tags",
+        "Description",
+        "Servers",
+        "Schema",
+        "Schema Properties",
+        "Logical Type Options",
+        "Quality Rules",
+        "Support",
+        "Pricing",
+        "Team",
+        "Roles",
+        "SLA Properties",
+        "Authoritative Definitions",
+        "Custom Properties",
+    }
+)
+
+# Optional sheets that must not appear in the minimal template
+_MINIMAL_EXCLUDED_SHEETS = frozenset(
+    {"Tags", "Description", "Quality Rules", "Support", "Pricing", "Team", "Roles"}
+)
+
+
+# Key headers expected in row 1 of full-template sheets
+_SHEET_HEADERS = (
+    ("Schema Properties", frozenset({"schemaName", "name", "logicalType"})),
+    ("Servers", frozenset({"server", "type"})),
+    ("Quality Rules", frozenset({"schemaName", "name", "dimension"})),
+    ("Description", frozenset({"usage", "purpose", "limitations"})),
+    ("Team", frozenset({"username", "name", "role"})),
+    ("Roles", frozenset({"role", "access"})),
+    ("SLA Properties", frozenset({"property", "value", "unit"})),
+)
+
+
+def _generate_once(template_type, include_examples):
+    """Generate a template in memory and return the .xlsx bytes."""
+    return TemplateGenerator().generate_template_to_buffer(
+        template_type, include_examples
+    )
+
+
+@contextmanager
+def _open_workbook(data, **kwargs):
+    """Load workbook bytes and close the workbook on exit, even on failure."""
+    wb = load_workbook(io.BytesIO(data), **kwargs)
+    try:
+        yield wb
+    finally:
         wb.close()
 
-    def test_required_template_generation(self, generator, temp_output_path):
-        """Test required template generation."""
-        generator.generate_template(
-            temp_output_path,
-            template_type=TemplateType.REQUIRED,
-            include_examples=True,
-        )
 
-        assert temp_output_path.exists()
+def _header_row(sheet):
+    """Return the values of the first row as one tuple."""
+    return next(sheet.iter_rows(min_row=1, max_row=1, values_only=True))
 
-        wb = load_workbook(temp_output_path)
 
-        # Check required template sheets
-        assert "📖 Instructions" in wb.sheetnames
-        assert "Basic Information" in wb.sheetnames
-        assert "Servers" in wb.sheetnames
-        assert "Schema" in wb.sheetnames
-        assert "Schema Properties" in wb.sheetnames
+# Templates are only read by the tests below, so each variant is built once,
+# in memory
+@pytest.fixture(scope="session")
+def minimal_template_bytes():
+    """Minimal template with example rows."""
+    return _generate_once(TemplateType.MINIMAL, True)
 
-        # Verify worksheet count (4 data + 1 instructions)
-        assert len(wb.sheetnames) == 5
 
-        wb.close()
+@pytest.fixture(scope="session")
+def minimal_no_examples_bytes():
+    """Minimal template with headers only."""
+    return _generate_once(TemplateType.MINIMAL, False)
 
-    def test_full_template_generation(self, generator, temp_output_path):
-        """Test full template generation."""
-        generator.generate_template(
-            temp_output_path, template_type=TemplateType.FULL, include_examples=True
-        )
 
-        assert temp_output_path.exists()
-
-        wb = load_workbook(temp_output_path)
-
-        # Check that all expected sheets exist
-        expected_sheets = [
-            "📖 Instructions",
-            "Basic Information",
-            "Tags",
-            "Description",
-            "Servers",
-            "Schema",
-            "Schema Properties",
-            "Logical Type Options",
-            "Quality Rules",
-            "Support",
-            "Pricing",
-            "Team",
-            "Roles",
-            "SLA Properties",
-            "Authoritative Definitions",
-            "Custom Properties",
-        ]
-
-        for sheet in expected_sheets:
-            assert sheet in wb.sheetnames, f"Missing sheet: {sheet}"
-
-        # Verify total worksheet count (15 data + 1 instructions)
-        assert len(wb.sheetnames) == 16
+@pytest.fixture(scope="session")
+def required_template_bytes():
+    """Required template with example rows."""
+    return _generate_once(TemplateType.REQUIRED, True)
 
-        wb.close()
 
-    def test_template_without_examples(self, generator, temp_output_path):
-        """Test template generation without examples."""
-        generator.generate_template(
-            temp_output_path, template_type=TemplateType.MINIMAL, include_examples=False
-        )
+@pytest.fixture(scope="session")
+def full_template_bytes():
+    """Full template with example rows."""
+    return _generate_once(TemplateType.FULL, True)
 
-        assert temp_output_path.exists()
 
-        wb = load_workbook(temp_output_path)
-        sheet = wb["Basic Information"]
+# Fully loaded workbooks for the style, comment and width tests, which read
+# formatting that read-only mode drops. Tests must not modify them.
+@pytest.fixture(scope="session")
+def minimal_wb(minimal_template_bytes):
+    """Minimal template loaded with styles."""
+    with _open_workbook(minimal_template_bytes) as wb:
+        yield wb
 
-        # Check that only headers exist (row 1)
-        # No example rows should be present (row 2 should be empty)
-        assert sheet.max_row == 1  # Only header row
 
-        wb.close()
+@pytest.fixture(scope="session")
+def full_wb(full_template_bytes):
+    """Full template loaded with styles."""
+    with _open_workbook(full_template_bytes) as wb:
+        yield wb
 
-    def test_template_with_examples(self, generator, temp_output_path):
-        """Test template generation with examples."""
-        generator.generate_template(
-            temp_output_path, template_type=TemplateType.MINIMAL, include_examples=True
-        )
-
-        assert temp_output_path.exists()
 
-        wb = load_workbook(temp_output_path)
-        sheet = wb["Basic Information"]
-
-        # Check that headers and examples exist
-        assert sheet.max_row >= 2  # Header + at least one example row
+class TestTemplateGenerator:
+    """Test suite for TemplateGenerator class."""
 
-        # Verify example data exists in row 2
-        assert sheet.cell(row=2, column=1).value is not None
+    @pytest.fixture(scope="module")
+    def generator(self):
+        """Create one TemplateGenerator shared by the tests in this module."""
+        return TemplateGenerator()
 
-        wb.close()
+    def test_generator_initialization(self, generator):
+        """Test that generator initializes correctly."""
+        assert generator is not None
+        assert generator.style_config is not None
+        assert "header_font" in generator.style_config
+        assert "required_header_fill" in generator.style_config
+        assert "optional_header_fill" in generator.style_config
 
-    def test_instructions_sheet_content(self, generator, temp_output_path):
+    @pytest.mark.parametrize(
+        "template_fixture, expected_sheets",
+        [
+            pytest.param("minimal_template_bytes", _MINIMAL_SHEETS, id="minimal"),
+            pytest.param("required_template_bytes", _REQUIRED_SHEETS, id="required"),
+            pytest.param("full_template_bytes", _FULL_SHEETS, id="full"),
+        ],
+    )
+    def test_template_sheet_layout(self, request, template_fixture, expected_sheets):
+        """Test each template type contains exactly its expected sheets."""
+        template_bytes = request.getfixturevalue(template_fixture)
+        with _open_workbook(template_bytes, read_only=True, data_only=True) as wb:
+            sheet_names = wb.sheetnames
+
+        # Sheet names are unique, so set equality also pins the sheet count
+        assert set(sheet_names) == expected_sheets
+
+    @pytest.mark.parametrize(
+        "template_fixture, include_examples",
+        [
+            pytest.param("minimal_template_bytes", True, id="with_examples"),
+            pytest.param("minimal_no_examples_bytes", False, id="without_examples"),
+        ],
+    )
+    def test_example_rows(self, request, template_fixture, include_examples):
+        """Test example rows follow the headers only when examples are included."""
+        template_bytes = request.getfixturevalue(template_fixture)
+        with _open_workbook(template_bytes, read_only=True, data_only=True) as wb:
+            sheet = wb["Basic Information"]
+
+            if include_examples:
+                # Header + at least one example row, with data in row 2
+                assert sheet.max_row >= 2
+                assert sheet.cell(row=2, column=1).value is not None
+            else:
+                # Only the header row
+                assert sheet.max_row == 1
+
+    def test_instructions_sheet_content(self, full_template_bytes):
         """Test that instructions sheet has proper content."""
-        generator.generate_template(
-            temp_output_path, template_type=TemplateType.FULL, include_examples=True
-        )
-
-        wb = load_workbook(temp_output_path)
-        instructions = wb["📖 Instructions"]
-
-        # Check for key instruction elements
-        cell_values = []
-        for row in instructions.iter_rows(values_only=True):
-            cell_values.extend([str(cell) for cell in row if cell])
-
-        content = " ".join(cell_values)
-
-        # Verify key instruction content
-        assert "ODCS Data Contract" in content
-        assert "Red Headers" in content or "RED" in content
-        assert "Blue Headers" in content or "BLUE" in content
-        assert "REQUIRED" in content
-        assert "OPTIONAL" in content
-
-        wb.close()
-
-    def test_header_styling(self, generator, temp_output_path):
+        # Not data_only: legend cells such as "= REQUIRED fields ..." start with
+        # "=" and are stored as formulas, which have no cached value.
+        with _open_workbook(full_template_bytes, read_only=True) as wb:
+            instructions = wb["📖 Instructions"]
+
+            # Check for key instruction elements
+            content = " ".join(
+                str(cell)
+                for cell in chain.from_iterable(
+                    instructions.iter_rows(values_only=True)
+                )
+                if cell
+            )
+
+            # Verify key instruction content
+            assert "ODCS Data Contract" in content
+            assert "Red Headers" in content or "RED" in content
+            assert "Blue Headers" in content or "BLUE" in content
+            assert "REQUIRED" in content
+            assert "OPTIONAL" in content
+
+    def test_header_styling(self, minimal_wb):
         """Test that headers have correct styling."""
-        generator.generate_template(
-            temp_output_path, template_type=TemplateType.MINIMAL, include_examples=True
-        )
-
-        wb = load_workbook(temp_output_path)
-        sheet = wb["Basic Information"]
+        sheet = minimal_wb["Basic Information"]
 
         # Check header row styling
         for col in range(1, 6):  # First 5 columns are required in minimal
@@ -195,16 +222,9 @@ class TestTemplateGenerator:
             if col <= 5:  # All basic info fields in minimal are required
                 assert cell.fill.start_color.index is not None
 
-        wb.close()
-
-    def test_required_vs_optional_headers(self, generator, temp_output_path):
+    def test_required_vs_optional_headers(self, full_wb):
         """Test that required and optional headers are styled differently."""
-        generator.generate_template(
-            temp_output_path, template_type=TemplateType.FULL, include_examples=True
-        )
-
-        wb = load_workbook(temp_output_path)
-        sheet = wb["Basic Information"]
+        sheet = full_wb["Basic Information"]
 
         # In full template, first 5 are required (red), rest are optional (blue)
         required_color = sheet.cell(row=1, column=1).fill.start_color.index
@@ -213,95 +233,27 @@ class TestTemplateGenerator:
         # Colors should be different
         assert required_color != optional_color
 
-        wb.close()
-
-    def test_cell_comments(self, generator, temp_output_path):
+    def test_cell_comments(self, full_wb):
         """Test that headers have help text comments."""
-        generator.generate_template(
-            temp_output_path, template_type=TemplateType.FULL, include_examples=True
-        )
-
-        wb = load_workbook(temp_output_path)
-        sheet = wb["Schema Properties"]
-
-        # Check that at least some headers have comments
-        comment_count = 0
-        for col in range(1, sheet.max_column + 1):
-            cell = sheet.cell(row=1, column=col)
-            if cell.comment:
-                comment_count += 1
+        sheet = full_wb["Schema Properties"]
 
         # At least some headers should have comments
-        assert comment_count > 0
+        assert any(cell.comment for cell in sheet[1]), "No header comments found"
 
-        wb.close()
+    @pytest.mark.parametrize(
+        "sheet_name, required_headers",
+        [pytest.param(name, headers, id=name) for name, headers in _SHEET_HEADERS],
+    )
+    def test_sheet_headers(self, full_wb, sheet_name, required_headers):
+        """Test each full-template sheet has its key headers in row 1."""
+        headers = set(_header_row(full_wb[sheet_name]))
 
-    def test_schema_properties_structure(self, generator, temp_output_path):
-        """Test Schema Properties worksheet structure."""
-        generator.generate_template(
-            temp_output_path, template_type=TemplateType.FULL, include_examples=True
-        )
-
-        wb = load_workbook(temp_output_path)
-        sheet = wb["Schema Properties"]
-
-        # Check required headers exist
-        headers = [sheet.cell(row=1, column=col).value for col in range(1, 18)]
-
-        assert "schemaName" in headers
-        assert "name" in headers
-        assert "logicalType" in headers
-
-        wb.close()
-
-    def test_servers_sheet_structure(self, generator, temp_output_path):
-        """Test Servers worksheet structure."""
-        generator.generate_template(
-            temp_output_path, template_type=TemplateType.FULL, include_examples=True
-        )
-
-        wb = load_workbook(temp_output_path)
-        sheet = wb["Servers"]
-
-        # Check required headers
-        headers = [
-            sheet.cell(row=1, column=col).value
-            for col in range(1, sheet.max_column + 1)
-        ]
-
-        assert "server" in headers
-        assert "type" in headers
-
-        wb.close()
-
-    def test_quality_rules_sheet(self, generator, temp_output_path):
-        """Test Quality Rules worksheet exists and has proper structure."""
-        generator.generate_template(
-            temp_output_path, template_type=TemplateType.FULL, include_examples=True
-        )
-
-        wb = load_workbook(temp_output_path)
-        sheet = wb["Quality Rules"]
-
-        headers = [
-            sheet.cell(row=1, column=col).value
-            for col in range(1, sheet.max_column + 1)
-        ]
+        missing = sorted(required_headers.difference(headers))
+        assert not missing, f"{sheet_name} missing headers: {missing}"
 
-        assert "schemaName" in headers
-        assert "name" in headers
-        assert "dimension" in headers
-
-        wb.close()
-
-    def test_example_values_format(self, generator, temp_output_path):
+    def test_example_values_format(self, minimal_wb):
         """Test that example values have correct styling."""
-        generator.generate_template(
-            temp_output_path, template_type=TemplateType.MINIMAL, include_examples=True
-        )
-
-        wb = load_workbook(temp_output_path)
-        sheet = wb["Basic Information"]
+        sheet = minimal_wb["Basic Information"]
 
         # Example row should have italic gray font
         example_cell = sheet.cell(row=2, column=1)
@@ -309,8 +261,6 @@ class TestTemplateGenerator:
         assert example_cell.font.italic is True
         assert example_cell.font.color.index is not None  # Has color
 
-        wb.close()
-
     def test_output_directory_creation(self, generator, tmp_path):
         """Test that output directory is created if it doesn't exist."""
         nested_path = tmp_path / "nested" / "directories" / "template.xlsx"
@@ -328,142 +278,40 @@ class TestTemplateGenerator:
         assert TemplateType.REQUIRED.value == "required"
         assert TemplateType.FULL.value == "full"
 
-    def test_column_width_adjustment(self, generator, temp_output_path):
+    def test_column_width_adjustment(self, minimal_wb):
         """Test that column widths are adjusted appropriately."""
-        generator.generate_template(
-            temp_output_path, template_type=TemplateType.MINIMAL, include_examples=True
-        )
-
-        wb = load_workbook(temp_output_path)
-        sheet = wb["Basic Information"]
+        sheet = minimal_wb["Basic Information"]
 
-        # Check that columns have reasonable widths
-        for col_letter in ["A", "B", "C", "D", "E"]:
-            width = sheet.column_dimensions[col_letter].width
-            assert width >= 12  # Minimum width
-            assert width <= 50  # Maximum width
+        # Read existing dimensions only; indexing a missing letter would add
+        # one to the shared workbook
+        widths = {
+            letter: dimension.width
+            for letter, dimension in sheet.column_dimensions.items()
+            if letter in {"A", "B", "C", "D", "E"}
+        }
 
-        wb.close()
+        # Check that columns have reasonable widths (min 12, max 50)
+        assert sorted(widths) == ["A", "B", "C", "D", "E"]
+        assert all(12 <= width <= 50 for width in widths.values()), widths
 
-    def test_tags_sheet_in_full_template(self, generator, temp_output_path):
+    def test_tags_sheet_in_full_template(self, full_template_bytes):
         """Test Tags sheet in full template."""
-        generator.generate_template(
-            temp_output_path, template_type=TemplateType.FULL, include_examples=True
-        )
+        with _open_workbook(full_template_bytes, read_only=True, data_only=True) as wb:
+            sheet = wb["Tags"]
 
-        wb = load_workbook(temp_output_path)
-        sheet = wb["Tags"]
+            # Check header
+            assert sheet.cell(row=1, column=1).value == "tag"
 
-        # Check header
-        assert sheet.cell(row=1, column=1).value == "tag"
+            # If examples are included, check for example tags
+            if sheet.max_row > 1:
+                assert sheet.cell(row=2, column=1).value is not None
 
-        # If examples are included, check for example tags
-        if sheet.max_row > 1:
-            assert sheet.cell(row=2, column=1).value is not None
-
-        wb.close()
-
-    def test_minimal_template_excludes_optional_sheets(
-        self, generator, temp_output_path
-    ):
+    def test_minimal_template_excludes_optional_sheets(self, minimal_template_bytes):
         """Test that minimal template doesn't include optional sheets."""
-        generator.generate_template(
-            temp_output_path, template_type=TemplateType.MINIMAL, include_examples=True
-        )
-
-        wb = load_workbook(temp_output_path)
-
-        # These sheets should NOT be in minimal template
-        optional_sheets = [
-            "Tags",
-            "Description",
-            "Quality Rules",
-            "Support",
-            "Pricing",
-            "Team",
-            "Roles",
-        ]
-
-        for sheet in optional_sheets:
-            assert sheet not in wb.sheetnames
-
-        wb.close()
-
-    def test_description_sheet_in_full_template(self, generator, temp_output_path):
-        """Test Description sheet structure."""
-        generator.generate_template(
-            temp_output_path, template_type=TemplateType.FULL, include_examples=True
-        )
-
-        wb = load_workbook(temp_output_path)
-        sheet = wb["Description"]
-
-        headers = [
-            sheet.cell(row=1, column=col).value
-            for col in range(1, sheet.max_column + 1)
-        ]
-
-        assert "usage" in headers
-        assert "purpose" in headers
-        assert "limitations" in headers
-
-        wb.close()
-
-    def test_team_sheet_structure(self, generator, temp_output_path):
-        """Test Team sheet structure."""
-        generator.generate_template(
-            temp_output_path, template_type=TemplateType.FULL, include_examples=True
-        )
-
-        wb = load_workbook(temp_output_path)
-        sheet = wb["Team"]
-
-        headers = [
-            sheet.cell(row=1, column=col).value
-            for col in range(1, sheet.max_column + 1)
-        ]
+        with _open_workbook(
+            minimal_template_bytes, read_only=True, data_only=True
+        ) as wb:
+            sheet_names = set(wb.sheetnames)
 
-        assert "username" in headers
-        assert "name" in headers
-        assert "role" in headers
-
-        wb.close()
-
-    def test_roles_sheet_structure(self, generator, temp_output_path):
-        """Test Roles sheet structure."""
-        generator.generate_template(
-            temp_output_path, template_type=TemplateType.FULL, include_examples=True
-        )
-
-        wb = load_workbook(temp_output_path)
-        sheet = wb["Roles"]
-
-        headers = [
-            sheet.cell(row=1, column=col).value
-            for col in range(1, sheet.max_column + 1)
-        ]
-
-        assert "role" in headers
-        assert "access" in headers
-
-        wb.close()
-
-    def test_sla_properties_sheet(self, generator, temp_output_path):
-        """Test SLA Properties sheet."""
-        generator.generate_template(
-            temp_output_path, template_type=TemplateType.FULL, include_examples=True
-        )
-
-        wb = load_workbook(temp_output_path)
-        sheet = wb["SLA Properties"]
-
-        headers = [
-            sheet.cell(row=1, column=col).value
-            for col in range(1, sheet.max_column + 1)
-        ]
-
-        assert "property" in headers
-        assert "value" in headers
-        assert "unit" in headers
-
-        wb.close()
+        unexpected = sorted(sheet_names.intersection(_MINIMAL_EXCLUDED_SHEETS))
+        assert not unexpected, f"Unexpected sheets: {unexpected}"
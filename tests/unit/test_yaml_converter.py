@@ -1,6 +1,7 @@
 """Unit tests for YAML conversion utilities."""
 
 import pytest
+import yaml
 from pathlib import Path
 
 from odcs_converter.yaml_converter import YAMLConverter
@@ -337,6 +338,38 @@ class TestYAMLConverter:
         )
         assert converted_data["metadata"]["count"] == original_data["metadata"]["count"]
 
+    @pytest.mark.parametrize(
+        "loader_name", ["SafeLoader", "CSafeLoader"], ids=["python", "libyaml"]
+    )
+    def test_roundtrip_with_each_yaml_loader(self, loader_name, monkeypatch):
+        """Test pure-Python and libyaml loaders give the same roundtrip."""
+        if not hasattr(yaml, loader_name):
+            pytest.skip("PyYAML was built without libyaml")
+        monkeypatch.setattr(YAMLConverter, "_loader", getattr(yaml, loader_name))
+
+        original_data = {
+            "version": "1.0.0",
+            "tags": ["test", "roundtrip"],
+            "description": {"usage": "Contract with émojis 🚀", "count": 42},
+            "active": True,
+            "nullable_field": None,
+        }
+
+        yaml_string = YAMLConverter.dict_to_yaml_string(original_data)
+
+        assert YAMLConverter.yaml_string_to_dict(yaml_string) == original_data
+
+    def test_non_bmp_characters_written_unescaped(self, temp_dir):
+        """Test that emoji are written as-is rather than as escape sequences."""
+        data = {"c": "ünïcødé 中文 🎉"}
+        yaml_file = temp_dir / "unicode.yaml"
+
+        yaml_string = YAMLConverter.dict_to_yaml_string(data)
+        YAMLConverter.dict_to_yaml(data, yaml_file)
+
+        assert yaml_string == "c: ünïcødé 中文 🎉\n"
+        assert yaml_file.read_text(encoding="utf-8") == yaml_string
+
     def test_roundtrip_file_conversion(self, temp_dir):
         """Test roundtrip file conversion: dict -> YAML file -> dict."""
         original_data = {
@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Any, Dict, Generator, List, Optional
 from unittest.mock import MagicMock
 import pytest
+from typer.testing import CliRunner
 
 
 class UnitTestHelper:
@@ -321,6 +322,41 @@ def parameterized_test_data():
     return ParameterizedTestData()
 
 
+@pytest.fixture(scope="session")
+def cli_runner():
+    """Provide one CliRunner; invoke() isolates its own streams per call."""
+    return CliRunner()
+
+
+# Style configuration written to cli_config_file
+CLI_STYLE_CONFIG: Dict[str, Any] = {"header_color": "blue"}
+
+
+# Input files for CLI tests, written once per session; tests must not modify them
+@pytest.fixture(scope="session")
+def cli_json_file(tmp_path_factory) -> Path:
+    """Provide a small JSON input file."""
+    path = tmp_path_factory.mktemp("cli") / "sample.json"
+    path.write_text(json.dumps({"test": "data"}))
+    return path
+
+
+@pytest.fixture(scope="session")
+def cli_excel_file(tmp_path_factory) -> Path:
+    """Provide a .xlsx input file whose content is not a real workbook."""
+    path = tmp_path_factory.mktemp("cli") / "dummy.xlsx"
+    path.write_bytes(b"dummy excel data")
+    return path
+
+
+@pytest.fixture(scope="session")
+def cli_config_file(tmp_path_factory) -> Path:
+    """Provide a style configuration file containing CLI_STYLE_CONFIG."""
+    path = tmp_path_factory.mktemp("cli") / "config.json"
+    path.write_text(json.dumps(CLI_STYLE_CONFIG))
+    return path
+
+
 # Custom decorators for unit tests
 def unit_test(func):
     """Decorator to mark a function as a unit test."""